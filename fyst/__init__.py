@@ -1,23 +1,23 @@
 """
 ```
-┌─────┐ ┌──────────────────────────────────────────────┐
-│     │ │            Format You Some Tables            │
-│     │ ├───────────┬───────────┬───────────┬──────────┤
-│     │ │     F     │     Y     │     S     │    T     │
-│     │ ├───────────┴───────────┴───────────┴──────────┤
-│     │ │  Format        You        Some       Tables  │
-│     │ └──────────────────────────────────────────────┘
-│  F  │ ┌──────────────────────────────────────────────┐
-│  Y  │ │                   Supports                   │
-│  S  │ ├───────────────────────┬──────────────────────┤
-│  T  │ │  -------------------  │ -------------------  │
-│     │ │    Row / Col spans    │    Nested tables     │
-│     │ │  -------------------  │ -------------------  │
-│     │ │    V / H alignment    │  Cascading styles    │
-│     │ │  -------------------  │ -------------------  │
-│     │ │     Border styles     │      Type safe       │
-│     │ │  -------------------  │ -------------------  │
-└─────┘ └───────────────────────┴──────────────────────┘
+┌─────┐ ┌───────────────────────────────────────────┐
+│     │ │          Format You Some Tables           │
+│     │ ├───────────┬───────┬──────────┬────────────┤
+│     │ │     F     │   Y   │    S     │     T      │
+│     │ ├───────────┴───────┴──────────┴────────────┤
+│     │ │  Format      You      Some       Tables   │
+│     │ └───────────────────────────────────────────┘
+│  F  │ ┌───────────────────────────────────────────┐
+│  Y  │ │                 Supports                  │
+│  S  │ ├───────────────────┬───────────────────────┤
+│  T  │ │-------------------│  -------------------  │
+│     │ │  Row / Col spans  │     Nested tables     │
+│     │ │-------------------│  -------------------  │
+│     │ │  V / H alignment  │   Cascading styles    │
+│     │ │-------------------│  -------------------  │
+│     │ │   Border styles   │       Type safe       │
+│     │ │-------------------│  -------------------  │
+└─────┘ └───────────────────┴───────────────────────┘
 ```
 """
 
@@ -0,0 +1,297 @@
+"""
+Renders CSV, TSV or JSON Lines as a table.
+
+Rows are streamed in chunks, so memory stays bounded on large inputs. The
+col widths are declared with `--widths`, or taken from the first
+`--sample` rows; longer values are truncated. An unreadable record, or one
+with more fields than there are cols, stops the output with its line
+number, unless `--skip-invalid` is given.
+
+```
+$ python -m fyst data.csv
+$ zcat logs.jsonl.gz | python -m fyst -f jsonl --max-width 40 | less -S
+```
+"""
+
+from __future__ import annotations as _annotations
+
+import argparse as _argparse
+import csv as _csv
+import json as _json
+import os as _os
+import sys as _sys
+from itertools import chain as _chain
+from itertools import islice as _islice
+from typing import Any as _Any
+from typing import Iterator as _Iterator
+from typing import Optional as _Optional
+from typing import Sequence as _Sequence
+from typing import TextIO as _TextIO
+
+from .style import BASIC_STYLE as _BASIC_STYLE
+from .style import BOX_STYLE as _BOX_STYLE
+from .style import Halign as _Halign
+from .style import Padding as _Padding
+from .width import center as _center
+from .width import ljust as _ljust
+from .width import rjust as _rjust
+from .width import str_width as _str_width
+from .width import truncate as _truncate
+
+_STYLES = {"box": _BOX_STYLE, "basic": _BASIC_STYLE}
+
+
+def _ints(s: str) -> list[int]:
+    return [int(v) for v in s.split(",")]
+
+
+def _padding(s: str) -> list[int]:
+    padding = _ints(s)
+    if len(padding) not in (1, 2, 4):
+        raise _argparse.ArgumentTypeError(
+            f"expected N, X,Y or L,T,R,B, got {s!r}")
+    return padding
+
+
+def _json_str(v: _Any) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, str):
+        return v
+    return _json.dumps(v, ensure_ascii=False)
+
+
+class _InputError(Exception):
+    """A record of the input that can't be read"""
+
+    def __init__(self, line: int, msg: str) -> None:
+        super().__init__(f"line {line}: {msg}")
+        self.line = line
+        """The line number of the record in the input"""
+
+
+def _read_records(
+    f: _TextIO,
+    fmt: str,
+    header: bool,
+    skip_invalid: bool = False,
+) -> _Iterator[tuple[int, list[str]]]:
+    """Yields each record with the line number it starts on"""
+    if fmt in ("csv", "tsv"):
+        reader = _csv.reader(f, delimiter="\t" if fmt == "tsv" else ",")
+        while True:
+            n = reader.line_num + 1
+            try:
+                record = next(reader)
+            except StopIteration:
+                return
+            except _csv.Error as e:
+                if not skip_invalid:
+                    raise _InputError(reader.line_num, str(e)) from None
+                continue
+            yield n, record
+    fields: _Optional[list[str]] = None
+    for n, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = _json.loads(line)
+        except _json.JSONDecodeError as e:
+            if skip_invalid:
+                continue
+            raise _InputError(
+                n, f"invalid JSON, {e.msg} at column {e.pos + 1}") from None
+        if isinstance(record, dict):
+            if fields is None:
+                fields = list(record.keys())  # type: ignore
+                if header:
+                    yield n, fields
+            yield n, [_json_str(record.get(k)) for k in fields]  # type: ignore
+        elif isinstance(record, list):
+            yield n, [_json_str(v) for v in record]  # type: ignore
+        else:
+            yield n, [_json_str(record)]
+
+
+def _fit(s: str, width: int, halign: _Halign) -> str:
+    s = _truncate(s.replace("\r", "").replace("\n", " "), width)
+    if halign == "middle":
+        return _center(s, width)
+    if halign == "right":
+        return _rjust(s, width)
+    return _ljust(s, width)
+
+
+def _rule(widths: list[int], l: str, rl: str, m: str, r: str) -> str:
+    return l + m.join(rl * w for w in widths) + r
+
+
+def _parse_args(argv: _Optional[_Sequence[str]]) -> _argparse.Namespace:
+    parser = _argparse.ArgumentParser(
+        prog="python -m fyst",
+        description="Format CSV, TSV or JSON Lines as a table.",
+    )
+    parser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        help="the file to read (default: stdin)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("csv", "tsv", "jsonl"),
+        help="the input format (default: from the file extension, or csv)",
+    )
+    parser.add_argument(
+        "-s",
+        "--style",
+        choices=tuple(_STYLES),
+        default="box",
+        help="the border style (default: box)",
+    )
+    parser.add_argument(
+        "-p",
+        "--padding",
+        type=_padding,
+        default=[1, 0],
+        help="the padding of each cel as N, X,Y or L,T,R,B (default: 1,0)",
+    )
+    parser.add_argument(
+        "-a",
+        "--halign",
+        choices=("left", "middle", "right"),
+        default="left",
+        help="the horizontal alignment of values (default: left)",
+    )
+    parser.add_argument(
+        "--header-rows",
+        type=int,
+        default=1,
+        help="the number of header rows, which are centered; for JSON objects the keys are the header (default: 1)",
+    )
+    parser.add_argument(
+        "-w",
+        "--widths",
+        type=_ints,
+        help="the width of each col as W1,W2,..., instead of sampling",
+    )
+    parser.add_argument(
+        "--max-width",
+        type=int,
+        help="the maximum width of any col",
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=1000,
+        help="the number of rows sampled to size the cols (default: 1000)",
+    )
+    parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="skip records that can't be read, instead of stopping at the first",
+    )
+    parser.add_argument(
+        "--chunk",
+        type=int,
+        default=256,
+        help="the number of rows written at a time (default: 256)",
+    )
+    return parser.parse_args(argv)
+
+
+def _render(args: _argparse.Namespace, f: _TextIO, out: _TextIO) -> None:
+    records = _read_records(f, args.format, args.header_rows > 0,
+                            args.skip_invalid)
+
+    sample: list[tuple[int, list[str]]] = []
+    widths: list[int] = args.widths or []
+    if len(widths) == 0:
+        sample = list(_islice(records, max(args.sample, 1)))
+        for _, record in sample:
+            if len(record) > len(widths):
+                widths.extend([0] * (len(record) - len(widths)))
+            for i, v in enumerate(record):
+                widths[i] = max(widths[i], _str_width(v.replace("\n", " ")))
+    if args.max_width is not None:
+        widths = [min(w, args.max_width) for w in widths]
+    widths = [max(w, 1) for w in widths]
+    if len(widths) == 0:
+        return
+
+    def fit() -> _Iterator[list[str]]:
+        i = 0
+        for n, record in _chain(sample, records):
+            if any(record[len(widths):]):
+                if args.skip_invalid:
+                    continue
+                raise _InputError(
+                    n, f"{len(record)} fields, expected at most {len(widths)}")
+            halign = "middle" if i < args.header_rows else args.halign
+            record.extend([""] * (len(widths) - len(record)))
+            yield [_fit(v, w, halign) for v, w in zip(record, widths)]
+            i += 1
+
+    # every row has the same shape, so rather than laying out a `Table`, the
+    # fitted values are joined into lines built once from the border style
+    style = _STYLES[args.style]
+    padding = _Padding(*args.padding)
+    cels = [padding.l + w + padding.r for w in widths]
+    top = _rule(cels, style.rd, style.rl, style.rld, style.ld)
+    sep = _rule(cels, style.rud, style.rl, style.rlud, style.lud)
+    bottom = _rule(cels, style.ru, style.rl, style.rlu, style.lu)
+    blank = _rule(cels, style.ud, " ", style.ud, style.ud) + "\n"
+    before = "\n" + blank * padding.t + style.ud + " " * padding.l
+    between = " " * padding.r + style.ud + " " * padding.l
+    after = " " * padding.r + style.ud + "\n" + blank * padding.b
+
+    rows = fit()
+    edge = top
+    written = False
+    while True:
+        chunk = list(_islice(rows, max(args.chunk, 1)))
+        if len(chunk) == 0:
+            break
+        parts: list[str] = []
+        for row in chunk:
+            parts.extend((edge, before, between.join(row), after))
+            edge = sep
+        out.write("".join(parts))
+        written = True
+    if written:
+        out.write(bottom + "\n")
+
+
+def main(argv: _Optional[_Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    if args.format is None:
+        ext = _os.path.splitext(args.file)[1].lower()
+        args.format = {
+            ".tsv": "tsv",
+            ".tab": "tsv",
+            ".jsonl": "jsonl",
+            ".ndjson": "jsonl",
+        }.get(ext, "csv")
+    try:
+        if args.file == "-":
+            _render(args, _sys.stdin, _sys.stdout)
+        else:
+            with open(args.file, newline="", encoding="utf-8") as f:
+                _render(args, f, _sys.stdout)
+        _sys.stdout.flush()
+    except _InputError as e:
+        _sys.stdout.flush()
+        name = "<stdin>" if args.file == "-" else args.file
+        print(f"python -m fyst: {name}: {e}", file=_sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # the reader went away (e.g. `| head`), so stop quietly
+        devnull = _os.open(_os.devnull, _os.O_WRONLY)
+        _os.dup2(devnull, _sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    _sys.exit(main())
@@ -0,0 +1,177 @@
+from __future__ import annotations as _annotations
+
+from typing import Literal as _Literal
+from typing import NamedTuple as _NamedTuple
+from typing import Optional as _Optional
+
+from .grid import Grid as _Grid
+from .grid import PointArg as _PointArg
+
+ColorName = (_Literal["black"] | _Literal["red"] | _Literal["green"]
+             | _Literal["yellow"] | _Literal["blue"] | _Literal["magenta"]
+             | _Literal["cyan"] | _Literal["white"] | _Literal["bright_black"]
+             | _Literal["bright_red"] | _Literal["bright_green"]
+             | _Literal["bright_yellow"] | _Literal["bright_blue"]
+             | _Literal["bright_magenta"] | _Literal["bright_cyan"]
+             | _Literal["bright_white"])
+
+Color = ColorName | int | tuple[int, int, int]
+"""A named ANSI color, a 256 color palette index, or an (r, g, b) tuple"""
+
+_COLOR_NAMES = (
+    "black",
+    "red",
+    "green",
+    "yellow",
+    "blue",
+    "magenta",
+    "cyan",
+    "white",
+)
+
+_RESET = "\x1b[0m"
+
+
+def _color_sgr(color: Color, base: int) -> str:
+    if isinstance(color, str):
+        if color.startswith("bright_"):
+            return str(base + 60 + _COLOR_NAMES.index(color[7:]))
+        return str(base + _COLOR_NAMES.index(color))
+    if isinstance(color, int):
+        return f"{base + 8};5;{color}"
+    r, g, b = color
+    return f"{base + 8};2;{r};{g};{b}"
+
+
+class Attr(_NamedTuple):
+    """The display attributes of a run of characters.
+
+    `None` / `False` fields leave the terminal default in place.
+    """
+    fg: _Optional[Color] = None
+    bg: _Optional[Color] = None
+    bold: bool = False
+
+    def merge(self, other: Attr) -> Attr:
+        """Returns `self` with the set fields of `other` painted over it.
+        """
+        return Attr(
+            other.fg if other.fg is not None else self.fg,
+            other.bg if other.bg is not None else self.bg,
+            other.bold or self.bold,
+        )
+
+    def sgr(self) -> str:
+        """The escape sequence that switches the terminal to this attr.
+        """
+        codes: list[str] = []
+        if self.bold:
+            codes.append("1")
+        if self.fg is not None:
+            codes.append(_color_sgr(self.fg, 30))
+        if self.bg is not None:
+            codes.append(_color_sgr(self.bg, 40))
+        if len(codes) == 0:
+            return ""
+        return "\x1b[" + ";".join(codes) + "m"
+
+
+_DEFAULT = Attr()
+
+_Run = tuple[int, int, Attr]
+"""(start, stop, attr) of a run of columns within a line"""
+
+
+class Attrs:
+    """Run-length encoded attributes of each line of a `Grid`.
+
+    Each line holds a sorted list of non-overlapping `(start, stop, attr)`
+    runs. Columns outside of any run use the default attr.
+    """
+
+    def __init__(self, size: _PointArg) -> None:
+        self.width, height = size
+        self.lines: list[list[_Run]] = [[] for _ in range(height)]
+
+    def __bool__(self) -> bool:
+        return any(len(l) > 0 for l in self.lines)
+
+    def paint(
+        self,
+        x: slice,
+        y: slice,
+        attr: Attr,
+    ) -> None:
+        """Merges `attr` over the columns `x` of lines `y`.
+
+        Args:
+            x: The columns to paint (the step is ignored)
+            y: The lines to paint (the step is ignored)
+            attr: The attr to merge over the existing runs
+        """
+        if attr == _DEFAULT:
+            return
+        x0, x1, _ = x.indices(self.width)
+        y0, y1, _ = y.indices(len(self.lines))
+        if x0 >= x1:
+            return
+        for l in range(y0, y1):
+            self.lines[l] = self._paint_line(self.lines[l], x0, x1, attr)
+
+    @staticmethod
+    def _paint_line(
+        runs: list[_Run],
+        x0: int,
+        x1: int,
+        attr: Attr,
+    ) -> list[_Run]:
+        out: list[_Run] = []
+        pos = x0
+        for start, stop, a in runs:
+            if stop <= x0 or start >= x1:
+                if start >= x1 and pos < x1:
+                    out.append((pos, x1, attr))
+                    pos = x1
+                out.append((start, stop, a))
+                continue
+            if start < x0:
+                out.append((start, x0, a))
+            if pos < start:
+                out.append((pos, start, attr))
+            out.append((max(start, x0), min(stop, x1), a.merge(attr)))
+            pos = min(stop, x1)
+            if stop > x1:
+                out.append((x1, stop, a))
+        if pos < x1:
+            out.append((pos, x1, attr))
+
+        merged: list[_Run] = []
+        for run in out:
+            if len(merged) > 0:
+                start, stop, a = merged[-1]
+                if stop == run[0] and a == run[2]:
+                    merged[-1] = (start, run[1], a)
+                    continue
+            merged.append(run)
+        return merged
+
+    def render(self, grid: _Grid[str]) -> str:
+        """Renders `grid` as a string, with escape sequences emitted only
+        at the boundaries of runs.
+        """
+        lines: list[str] = []
+        for y in range(grid.height):
+            cells = [str(c) for c in grid.line(y)]
+            runs = self.lines[y] if y < len(self.lines) else []
+            if len(runs) == 0:
+                lines.append("".join(cells))
+                continue
+            s = ""
+            pos = 0
+            for start, stop, a in runs:
+                s += "".join(cells[pos:start])
+                s += a.sgr() + "".join(cells[start:stop]) + _RESET
+                pos = stop
+            s += "".join(cells[pos:])
+            lines.append(s)
+        return "\n".join(lines)
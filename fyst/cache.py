@@ -0,0 +1,129 @@
+from __future__ import annotations as _annotations
+
+import hashlib as _hashlib
+import os as _os
+import tempfile as _tempfile
+from pathlib import Path as _Path
+from typing import Optional as _Optional
+
+from .table import Table as _Table
+
+_VERSION = 2
+"""Bumped whenever the rendered output of an unchanged table may change"""
+
+_SUFFIX = ".fyst"
+
+
+class RenderCache:
+    """An opt-in on-disk cache of rendered tables.
+
+    Entries are keyed by a hash of the content and styles of the table (and
+    its `BorderStyle`), so a table that hasn't changed between runs is read
+    back from disk instead of being rendered.
+
+    Entries are written to a temporary file and atomically moved into place,
+    so several processes may share a directory. When the directory grows
+    beyond `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        directory: str | _os.PathLike[str],
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            directory: The directory the entries are stored in. Created if it doesn't exist.
+            max_bytes: The total size of the entries to keep
+        """
+        self.directory = _Path(directory)
+        """The directory the entries are stored in"""
+        self.max_bytes = max_bytes
+        """The total size of the entries to keep"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, table: _Table) -> str:
+        """The content hash of `table`
+        """
+        data = repr((_VERSION, table.content_key())).encode()
+        return _hashlib.blake2b(data, digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> _Path:
+        return self.directory / (key + _SUFFIX)
+
+    def get(self, table: _Table) -> _Optional[str]:
+        """Returns the cached rendering of `table`, or `None`
+        """
+        return self._get(self.key(table))
+
+    def _get(self, key: str) -> _Optional[str]:
+        path = self._path(key)
+        try:
+            s = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            _os.utime(path)
+        except OSError:
+            pass
+        return s
+
+    def put(self, table: _Table, s: str) -> None:
+        """Stores `s` as the rendering of `table`
+        """
+        self._put(self.key(table), s)
+
+    def _put(self, key: str, s: str) -> None:
+        fd, tmp = _tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with _os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(s)
+            _os.replace(tmp, self._path(key))
+        except BaseException:
+            try:
+                _os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._evict()
+
+    def render(self, table: _Table) -> str:
+        """Returns `str(table)`, reading it from or writing it to the cache
+        """
+        key = self.key(table)
+        s = self._get(key)
+        if s is None:
+            s = str(table)
+            self._put(key, s)
+        return s
+
+    def clear(self) -> None:
+        """Removes every entry from the cache
+        """
+        for path in self.directory.glob("*" + _SUFFIX):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, _Path]] = []
+        total = 0
+        for path in self.directory.glob("*" + _SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
@@ -0,0 +1,77 @@
+from __future__ import annotations as _annotations
+
+from typing import Any as _Any
+from typing import Callable as _Callable
+from typing import Optional as _Optional
+from typing import Sequence as _Sequence
+
+FormatArg = str | _Callable[[_Any], str]
+"""A `format()` spec (e.g. `",.2f"`) or a function converting a value to a string"""
+
+
+class Formatter:
+    """A value format compiled once and applied to a whole column at a time.
+
+    `str` and `None` values (e.g. headers and blank cels) are passed through
+    untouched, everything else is formatted exactly once.
+    """
+
+    def __init__(
+        self,
+        spec: FormatArg = "",
+        decimal: bool = False,
+    ) -> None:
+        """
+        Args:
+            spec: A `format()` spec (e.g. `",.2f"`) or a function converting a value to a string
+            decimal: Whether to pad the formatted values so their decimal points line up
+        """
+        self.spec = spec
+        """The format spec or function"""
+        self.decimal = decimal
+        """Whether the decimal points of the formatted values line up"""
+        if callable(spec):
+            self._fn: _Callable[[_Any], str] = spec
+        elif spec:
+            self._fn = ("{:" + spec + "}").format
+        else:
+            self._fn = str
+
+    def format_column(self, values: _Sequence[_Any]) -> list[_Optional[str]]:
+        """Formats a column of values in one pass.
+
+        Returns:
+            The formatted values, or `None` for the values that are
+            passed through (or can't be formatted with the spec)
+        """
+        fn = self._fn
+        out: list[_Optional[str]] = []
+        for v in values:
+            if v is None or isinstance(v, str):
+                out.append(None)
+                continue
+            try:
+                out.append(fn(v))
+            except (TypeError, ValueError):
+                out.append(None)
+        if self.decimal:
+            _align_decimals(out)
+        return out
+
+
+def _align_decimals(values: list[_Optional[str]]) -> None:
+    parts: list[tuple[int, str, str]] = []
+    for i, s in enumerate(values):
+        if s is None or "\n" in s:
+            continue
+        p = s.rfind(".")
+        if p == -1:
+            parts.append((i, s, ""))
+        else:
+            parts.append((i, s[:p], s[p:]))
+    if len(parts) == 0:
+        return
+    int_w = max(len(ip) for _, ip, _ in parts)
+    frac_w = max(len(fp) for _, _, fp in parts)
+    for i, ip, fp in parts:
+        values[i] = ip.rjust(int_w) + fp.ljust(frac_w)
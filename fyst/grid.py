@@ -1,9 +1,12 @@
 from __future__ import annotations as _annotations
 
 from collections import UserList as _UserList
+from typing import Callable as _Callable
 from typing import NamedTuple as _NamedTuple
 from typing import TypeVar as _TypeVar
 
+from .width import str_cells as _str_cells
+
 
 class Point(_NamedTuple):
     x: int
@@ -46,7 +49,7 @@ class Grid(_UserList[list[T]]):
 
     @classmethod
     def from_str(cls, s: str, blank: str = " ") -> Grid[str]:
-        data: list[list[str]] = [list(l) for l in s.split("\n")]
+        data: list[list[str]] = [_str_cells(l) for l in s.split("\n")]
         w = 0
         for col in data:
             w = max(w, len(col))
@@ -63,6 +66,12 @@ class Grid(_UserList[list[T]]):
         grid = Grid[T](data)
         return grid
 
+    @classmethod
+    def sparse(cls, size: PointArg, value: T) -> SparseGrid[T]:
+        """Creates a `SparseGrid` of `size` filled with `value`
+        """
+        return SparseGrid[T](size, value)
+
     @property
     def root_width(self) -> int:
         return len(self.data)
@@ -99,6 +108,23 @@ class Grid(_UserList[list[T]]):
     def copy(self) -> Grid[T]:
         return Grid(self._get_view_data())
 
+    def line(self, y: int) -> list[T]:
+        """The values along line `y` of the view
+        """
+        ys = range(*self.view.y.indices(self.root_height))
+        return [col[ys[y]] for col in self.data[self.view.x]]
+
+    def _put_h(self, x: int, y: int, values: list[T]) -> None:
+        """Writes `values` along line `y` starting at col `x` (root coords)
+        """
+        for i, v in enumerate(values):
+            self.data[x + i][y] = v
+
+    def _put_v(self, x: int, y: int, values: list[T]) -> None:
+        """Writes `values` down col `x` starting at line `y` (root coords)
+        """
+        self.data[x][y:y + len(values)] = values
+
     def item(self) -> T:
         if self.width != 1 or self.height != 1: raise IndexError
         return self._get_view_data()[0][0]
@@ -111,39 +137,70 @@ class Grid(_UserList[list[T]]):
         data: list[list[T]] = [c[y] for c in self.data[x]]
         return data
 
-    def __or__(self, other: Grid[T] | T) -> Grid[T]:
-        _, other = self._broadcast(_View(), other)
-        if self.size != other.size:
+    def _combine(
+        self,
+        other: Grid[T] | T,
+        fn: _Callable[[T, T], T],
+    ) -> Grid[T]:
+        vself = self._get_view_data()
+        if not isinstance(other, Grid):
+            return Grid[T]([[fn(a, other) for a in col]  # type: ignore
+                            for col in vself])
+        vother: list[list[T]] = other._get_view_data()  # type: ignore
+        ow, oh = other.size  # type: ignore
+        if ow not in (1, self.width) or oh not in (1, self.height):
             raise IndexError
         if self.size.x == 0 or self.size.y == 0:
             return self.copy()
         data: list[list[T]] = []
-        vself = self._get_view_data()
-        vother = other._get_view_data()
         for i, col in enumerate(vself):
-            other_col = vother[i]
-            data.append([
-                a | b  # type: ignore
-                for a, b in zip(col, other_col)
-            ])
+            other_col = vother[0 if ow == 1 else i]
+            if oh == 1:
+                b = other_col[0]
+                data.append([fn(a, b) for a in col])
+                continue
+            data.append([fn(a, b) for a, b in zip(col, other_col)])
         return Grid[T](data)
 
+    def __or__(self, other: Grid[T] | T) -> Grid[T]:
+        return self._combine(other, lambda a, b: a | b)  # type: ignore
+
     def __and__(self, other: Grid[T] | T) -> Grid[T]:
-        _, other = self._broadcast(_View(), other)
-        if self.size != other.size:
-            raise IndexError
-        if self.size.x == 0 or self.size.y == 0:
-            return self.copy()
-        data: list[list[T]] = []
-        vself = self._get_view_data()
-        vother = other._get_view_data()
-        for i, col in enumerate(vself):
-            other_col = vother[i]
-            data.append([
-                a & b  # type: ignore
-                for a, b in zip(col, other_col)
-            ])
-        return Grid[T](data)
+        return self._combine(other, lambda a, b: a & b)  # type: ignore
+
+    def __ior__(self, other: Grid[T] | T) -> Grid[T]:
+        if isinstance(other, Grid):
+            return self | other  # type: ignore
+        self.map(lambda a: a | other)  # type: ignore
+        return self
+
+    def __iand__(self, other: Grid[T] | T) -> Grid[T]:
+        if isinstance(other, Grid):
+            return self & other  # type: ignore
+        self.map(lambda a: a & other)  # type: ignore
+        return self
+
+    def fill(self, value: T) -> None:
+        """Sets every value in the view to `value`, in place
+        """
+        self._assign(*self._view_ranges(), value)
+
+    def blit(self, other: Grid[T], pos: PointArg = (0, 0)) -> None:
+        """Copies `other` into the view with its top left corner at `pos`.
+
+        `other` is clipped to the view.
+        """
+        x, y = pos
+        self[x, y] = other
+
+    def map(self, fn: _Callable[[T], T]) -> None:
+        """Replaces every value in the view with `fn(value)`, in place
+        """
+        xs, ys = self._view_ranges()
+        for sx in xs:
+            col = self.data[sx]
+            for sy in ys:
+                col[sy] = fn(col[sy])
 
     def __repr__(self) -> str:
         l: list[str] = []
@@ -155,69 +212,98 @@ class Grid(_UserList[list[T]]):
             l.append(s)
         return "\n".join(l)
 
-    def _broadcast_grid(
+    def _view_ranges(self) -> tuple[range, range]:
+        return (
+            range(*self.view.x.indices(self.root_width)),
+            range(*self.view.y.indices(self.root_height)),
+        )
+
+    def _broadcast(
         self,
         pos: _broadcastable,
-        other: Grid[T],
-    ) -> tuple[tuple[slice, slice], Grid[T]]:
-        vself = self._get_view_data()
-        # self[#:#:#]
-        if isinstance(pos, int):
-            pos = slice(pos, pos + 1 if pos != -1 else None)
-        if isinstance(pos, slice):
-            x_repeat = len(vself[pos]) if other.width == 1 else 1
-            y_repeat = self.height if other.height == 1 else 1
-            if x_repeat > 1 or y_repeat > 1:
-                other = other.copy().repeat((x_repeat, y_repeat))
-
-            if other.height != self.height: raise IndexError
-            if other.width != len(vself[pos]): raise IndexError
-
-            x = pos
-            y = slice(None)
-            return (
-                _combine_slices(self.root_width, self.view.x, x),
-                _combine_slices(self.root_height, self.view.y, y),
-            ), other
-
-        # self[#:#:#, #:#:#]
-        x, y = pos
+        other: T | Grid[T],
+    ) -> tuple[range, range, bool]:
+        """Resolves `self[pos] = other` to the root cols / lines it writes.
+
+        Returns:
+            The cols and lines, and whether `other` is being pasted
+            (and may be clipped) rather than broadcast
+        """
+        xy: tuple[int | slice, int | slice]
+        if isinstance(pos, (int, slice)):
+            # self[#:#:#]
+            xy = (pos, slice(None))
+        else:
+            # self[#:#:#, #:#:#]
+            xy = (pos[0], pos[1])
+        x, y = xy
 
         # paste
-        if isinstance(x, int) and isinstance(y, int):
-            x = slice(x, x + other.width if x + other.width != 0 else None)
-            y = slice(y, y + other.height if y + other.height != 0 else None)
-            return (
-                _combine_slices(self.root_width, self.view.x, x),
-                _combine_slices(self.root_height, self.view.y, y),
-            ), other
+        paste = False
+        if isinstance(other, Grid) and isinstance(x, int) and isinstance(
+                y, int):
+            paste = True
+            w, h = other.size
+            x = slice(x, x + w if x + w != 0 else None)
+            y = slice(y, y + h if y + h != 0 else None)
 
         if isinstance(x, int):
             x = slice(x, x + 1 if x != -1 else None)
         if isinstance(y, int):
             y = slice(y, y + 1 if y != -1 else None)
-        w = len(vself[x])
-        h = len(vself[0][y])
-        x_repeat = w if other.width == 1 else 1
-        y_repeat = h if other.height == 1 else 1
-        if x_repeat > 1 or y_repeat > 1:
-            other = other.copy().repeat((x_repeat, y_repeat))
-        if other.width != w: raise IndexError
-        if other.height != h: raise IndexError
+        x = _combine_slices(self.root_width, self.view.x, x)
+        y = _combine_slices(self.root_height, self.view.y, y)
         return (
-            _combine_slices(self.root_width, self.view.x, x),
-            _combine_slices(self.root_height, self.view.y, y),
-        ), other
-
-    def _broadcast(
+            range(*x.indices(self.root_width)),
+            range(*y.indices(self.root_height)),
+            paste,
+        )
+
+    @staticmethod
+    def _source(
+        xs: range,
+        ys: range,
+        other: T | Grid[T],
+        paste: bool,
+    ) -> _Callable[[int], list[T]]:
+        """Returns the values written to the `i`th of `xs`.
+
+        A scalar or 1 wide / tall `other` is broadcast with a stride of 0,
+        without building the repeated grid.
+        """
+        if not isinstance(other, Grid):
+            values = [other] * len(ys)
+            return lambda _: values
+
+        src: list[list[T]] = other._get_view_data()  # type: ignore
+        ow, oh = other.size  # type: ignore
+        if paste:
+            if ow < len(xs) or oh < len(ys): raise IndexError
+            return lambda i: src[i][:len(ys)]
+        if ow not in (1, len(xs)): raise IndexError
+        if oh not in (1, len(ys)): raise IndexError
+        if oh == 1 and len(ys) != 1:
+            return lambda i: src[0 if ow == 1 else i] * len(ys)
+        return lambda i: src[0 if ow == 1 else i]
+
+    def _assign(
         self,
-        pos: _broadcastable,
+        xs: range,
+        ys: range,
         other: T | Grid[T],
-    ) -> tuple[tuple[slice, slice], Grid[T]]:
-        if isinstance(other, Grid):
-            return self._broadcast_grid(pos, other)  # type: ignore
-        else:
-            return self._broadcast_grid(pos, Grid[T]([[other]]))
+        paste: bool = False,
+    ) -> None:
+        if len(xs) == 0 or len(ys) == 0:
+            return
+        source = self._source(xs, ys, other, paste)
+        for i, sx in enumerate(xs):
+            values = source(i)
+            if ys.step == 1:
+                self.data[sx][ys.start:ys.start + len(ys)] = values
+                continue
+            col = self.data[sx]
+            for j, sy in enumerate(ys):
+                col[sy] = values[j]
 
     def __getitem__(self, pos: _broadcastable) -> Grid[T]:
         if isinstance(pos, int):
@@ -238,11 +324,135 @@ class Grid(_UserList[list[T]]):
         return grid
 
     def __setitem__(self, pos: _broadcastable, other: T | Grid[T]) -> None:
-        (x, y), other = self._broadcast(pos, other)
-        ox = 0
-        for sx in range(*x.indices(self.root_width)):
-            oy = 0
-            for sy in range(*y.indices(self.root_height)):
-                self.data[sx][sy] = other[ox, oy].item()
-                oy += 1
-            ox += 1
+        xs, ys, paste = self._broadcast(pos, other)
+        self._assign(xs, ys, other, paste)
+
+
+_Span = tuple[int, list[T]]
+
+
+class SparseGrid(Grid[T]):
+    """A `Grid` that only stores the runs of values written to each line.
+
+    Every other position holds `blank`, without being allocated, so large
+    empty regions cost nothing until the grid is converted to a dense
+    `Grid` (`copy()`) or a string.
+    """
+
+    def __init__(
+        self,
+        size: PointArg,
+        blank: T,
+        lines: list[list[_Span[T]]] | None = None,
+        view: _View = _View(),
+    ) -> None:
+        super().__init__([], view)
+        self.blank = blank
+        """The value of every position that hasn't been written"""
+        self._root_size = Point(*size)
+        self.lines: list[list[_Span[T]]] = (lines if lines is not None else
+                                           [[] for _ in range(size[1])])
+        """The sorted, non-overlapping (x, values) runs of each line"""
+
+    @property
+    def root_width(self) -> int:
+        return self._root_size.x
+
+    @property
+    def root_height(self) -> int:
+        return self._root_size.y
+
+    def _root_line(self, y: int) -> list[T]:
+        line = [self.blank] * self.root_width
+        for x, values in self.lines[y]:
+            line[x:x + len(values)] = values
+        return line
+
+    def line(self, y: int) -> list[T]:
+        ys = range(*self.view.y.indices(self.root_height))
+        return self._root_line(ys[y])[self.view.x]
+
+    def _get_view_data(self, subview: _View | None = None) -> list[list[T]]:
+        view = self.view if subview is None else self[subview.x, subview.y].view
+        ys = range(*view.y.indices(self.root_height))
+        lines = [self._root_line(y)[view.x] for y in ys]
+        if len(lines) == 0:
+            return [[] for _ in range(self.width)]
+        return [list(col) for col in zip(*lines)]
+
+    def item(self) -> T:
+        if self.width != 1 or self.height != 1: raise IndexError
+        return self.line(0)[0]
+
+    def _put_h(self, x: int, y: int, values: list[T]) -> None:
+        if len(values) == 0:
+            return
+        values = list(values)
+        end = x + len(values)
+        runs: list[_Span[T]] = []
+        placed = False
+        for s, v in self.lines[y]:
+            e = s + len(v)
+            if e < x:
+                runs.append((s, v))
+                continue
+            if s > end:
+                if not placed:
+                    runs.append((x, values))
+                    placed = True
+                runs.append((s, v))
+                continue
+            # overlapping or touching, so merge into a single run
+            if e > end:
+                values = values + v[end - s:]
+                end = e
+            if s < x:
+                values = v[:x - s] + values
+                x = s
+        if not placed:
+            runs.append((x, values))
+        self.lines[y] = runs
+
+    def _put_v(self, x: int, y: int, values: list[T]) -> None:
+        for i, v in enumerate(values):
+            self._put_h(x, y + i, [v])
+
+    def __getitem__(self, pos: _broadcastable) -> SparseGrid[T]:
+        view = super().__getitem__(pos).view
+        return SparseGrid[T](self._root_size, self.blank, self.lines, view)
+
+    def _put_line(self, xs: range, y: int, values: list[T]) -> None:
+        if xs.step == 1:
+            self._put_h(xs.start, y, values)
+            return
+        for i, x in enumerate(xs):
+            self._put_h(x, y, [values[i]])
+
+    def _assign(
+        self,
+        xs: range,
+        ys: range,
+        other: T | Grid[T],
+        paste: bool = False,
+    ) -> None:
+        if len(xs) == 0 or len(ys) == 0:
+            return
+        source = self._source(xs, ys, other, paste)
+        if not isinstance(other, Grid):
+            values = [other] * len(xs)
+            for y in ys:
+                self._put_line(xs, y, values)
+            return
+        cols = [source(i) for i in range(len(xs))]
+        for j, y in enumerate(ys):
+            self._put_line(xs, y, [col[j] for col in cols])
+
+    def map(self, fn: _Callable[[T], T]) -> None:
+        xs, ys = self._view_ranges()
+        for y in ys:
+            line = self._root_line(y)
+            self._put_line(xs, y, [fn(line[x]) for x in xs])
+
+    def __repr__(self) -> str:
+        return "\n".join("".join(str(v) for v in self.line(y))
+                         for y in range(self.height))
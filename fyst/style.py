@@ -11,6 +11,8 @@ from typing import TypeVar as _TypeVar
 
 from typing_extensions import NotRequired as _NotRequired
 
+from .attr import Color as _Color
+
 V = _TypeVar("V")
 
 
@@ -65,6 +67,10 @@ class StyleArg(_TypedDict):
     border: _NotRequired[_BorderArg]
     halign: _NotRequired[Halign]
     valign: _NotRequired[Valign]
+    fg: _NotRequired[_Color]
+    bg: _NotRequired[_Color]
+    bold: _NotRequired[bool]
+    border_fg: _NotRequired[_Color]
 
 
 class StyleOpt(_TypedDict):
@@ -72,6 +78,10 @@ class StyleOpt(_TypedDict):
     border: _Optional[Border]
     halign: _Optional[Halign]
     valign: _Optional[Valign]
+    fg: _Optional[_Color]
+    bg: _Optional[_Color]
+    bold: _Optional[bool]
+    border_fg: _Optional[_Color]
 
 
 class Style(_NamedTuple):
@@ -79,6 +89,10 @@ class Style(_NamedTuple):
     border: Border
     halign: Halign
     valign: Valign
+    fg: _Optional[_Color]
+    bg: _Optional[_Color]
+    bold: _Optional[bool]
+    border_fg: _Optional[_Color]
 
 
 class Stylable:
@@ -98,6 +112,18 @@ class Stylable:
         self.valign = style["valign"] if "valign" in style else None
         """The element's valign
         """
+        self.fg = style["fg"] if "fg" in style else None
+        """The element's foreground color
+        """
+        self.bg = style["bg"] if "bg" in style else None
+        """The element's background color
+        """
+        self.bold = style["bold"] if "bold" in style else None
+        """Whether the element's content is bold
+        """
+        self.border_fg = style["border_fg"] if "border_fg" in style else None
+        """The foreground color of the element's border
+        """
 
     def _cascade_style(self, *parents: Stylable) -> None:
         style = {f: getattr(self, f) for f in Style._fields}
@@ -1,12 +1,24 @@
 from __future__ import annotations as _annotations
 
+from bisect import bisect_left as _bisect_left
+from bisect import bisect_right as _bisect_right
 from collections import UserList as _UserList
+from dataclasses import astuple as _astuple
 from enum import IntFlag as _IntFlag
+from itertools import zip_longest as _zip_longest
 from typing import Any as _Any
+from typing import Iterable as _Iterable
+from typing import Mapping as _Mapping
 from typing import NamedTuple as _NamedTuple
+from typing import Optional as _Optional
+from typing import Sequence as _Sequence
 
 from typing_extensions import Unpack as _Unpack
 
+from .attr import Attr as _Attr
+from .attr import Attrs as _Attrs
+from .format import FormatArg as _FormatArg
+from .format import Formatter
 from .grid import Grid as _Grid
 from .grid import Point as _Point
 from .grid import PointArg as _PointArg
@@ -15,7 +27,11 @@ from .style import Border as _Border
 from .style import BorderStyle as _BorderStyle
 from .style import Padding as _Padding
 from .style import Stylable
+from .style import Style as _Style
 from .style import StyleArg as _StyleArg
+from .width import center as _center
+from .width import rjust as _rjust
+from .width import str_width as _str_width
 
 
 class _RCSizes(_NamedTuple):
@@ -23,6 +39,43 @@ class _RCSizes(_NamedTuple):
     cols: list[int]
 
 
+class Measurement(_NamedTuple):
+    """The size of a table's output, as measured by `Table.measure()`
+    """
+    width: int
+    """The width of the output in characters"""
+    height: int
+    """The height of the output in lines"""
+    cols: list[int]
+    """The width of each col"""
+    rows: list[int]
+    """The height of each row"""
+    memory: int
+    """A rough estimate of the bytes used to render the output"""
+
+
+# Peak bytes allocated while rendering, fitted to tables of 5-150 rows and
+# 1-15 cols on CPython 3.11
+
+_RENDER_BYTES_PER_CHAR = 20
+"""Per output character of a `Grid` (a pointer in the grid, its lines while
+joining, and the output string)"""
+
+_RENDER_BYTES_PER_CEL = 200
+"""Per cel of a `Grid` (its content grid, and its border edges, which are kept
+until every border is drawn)"""
+
+_SPARSE_BYTES_PER_CHAR = 7
+"""Per output character of a `SparseGrid` (only the output string, as the
+lines are filled in one at a time)"""
+
+_SPARSE_BYTES_PER_LINE = 560
+"""Per line of a `SparseGrid` (the list of runs on each line)"""
+
+_SPARSE_BYTES_PER_CEL = 650
+"""Per cel of a `SparseGrid` (the runs written for its content and borders)"""
+
+
 class _Con(_IntFlag):
     N = 0
     L = 1
@@ -31,16 +84,168 @@ class _Con(_IntFlag):
     D = 8
 
 
+_Run = tuple[int, int]
+
+
+def _merge_runs(runs: list[_Run]) -> list[_Run]:
+    runs.sort()
+    merged: list[_Run] = []
+    for a, b in runs:
+        if len(merged) > 0 and a <= merged[-1][1]:
+            if b > merged[-1][1]:
+                merged[-1] = (merged[-1][0], b)
+            continue
+        merged.append((a, b))
+    return merged
+
+
+def _run_cons(
+    runs: list[_Run],
+    starts: list[int],
+    p: int,
+    lo: _Con,
+    hi: _Con,
+) -> _Con:
+    i = _bisect_right(starts, p) - 1
+    if i < 0 or runs[i][1] < p:
+        return _Con.N
+    a, b = runs[i]
+    if a == b:
+        return lo | hi
+    return (lo if p > a else _Con.N) | (hi if p < b else _Con.N)
+
+
+class _Borders:
+    """The borders of a table as runs of horizontal and vertical segments.
+
+    Collinear segments along a row / col boundary are merged, so filling the
+    borders only visits each boundary once, and the junction characters
+    are only resolved where segments end or cross.
+    """
+
+    def __init__(self) -> None:
+        self.h: dict[int, list[_Run]] = {}
+        """The (x0, x1) runs along each line y (inclusive)"""
+        self.v: dict[int, list[_Run]] = {}
+        """The (y0, y1) runs along each col x (inclusive)"""
+
+    def add_h(self, y: int, x0: int, x1: int) -> None:
+        self.h.setdefault(y, []).append((x0, x1))
+
+    def add_v(self, x: int, y0: int, y1: int) -> None:
+        self.v.setdefault(x, []).append((y0, y1))
+
+    def fill(self, grid: _Grid[str], border_style: _BorderStyle) -> None:
+        """Draws the borders onto `grid` (which must not be a view)
+        """
+        width, height = grid.root_width, grid.root_height
+        chars = _con_chars(border_style)
+        h = {
+            y: _merge_runs([(max(a, 0), min(b, width - 1)) for a, b in runs])
+            for y, runs in self.h.items() if 0 <= y < height
+        }
+        v = {
+            x: _merge_runs([(max(a, 0), min(b, height - 1)) for a, b in runs])
+            for x, runs in self.v.items() if 0 <= x < width
+        }
+        h_starts = {y: [a for a, _ in runs] for y, runs in h.items()}
+        v_starts = {x: [a for a, _ in runs] for x, runs in v.items()}
+        h_lines = sorted(h)
+
+        points: set[tuple[int, int]] = set()
+        for y, runs in h.items():
+            for a, b in runs:
+                grid._put_h(a, y, [border_style.rl] * (b - a + 1))
+                points.add((a, y))
+                points.add((b, y))
+        for x, runs in v.items():
+            for a, b in runs:
+                grid._put_v(x, a, [border_style.ud] * (b - a + 1))
+                points.add((x, a))
+                points.add((x, b))
+                i = _bisect_right(h_lines, a - 1)
+                while i < len(h_lines) and h_lines[i] <= b:
+                    y = h_lines[i]
+                    if _run_cons(h[y], h_starts[y], x, _Con.L, _Con.R):
+                        points.add((x, y))
+                    i += 1
+
+        for x, y in points:
+            con = _Con.N
+            if y in h:
+                con |= _run_cons(h[y], h_starts[y], x, _Con.L, _Con.R)
+            if x in v:
+                con |= _run_cons(v[x], v_starts[x], y, _Con.U, _Con.D)
+            grid._put_h(x, y, [chars[con]])
+
+
+def _con_chars(border_style: _BorderStyle) -> list[str]:
+    chars = [" "] * 16
+    for con in range(1, 16):
+        if con & (_Con.R | _Con.L):
+            chars[con] = border_style.rl
+        else:
+            chars[con] = border_style.ud
+    chars[_Con.R | _Con.L | _Con.U | _Con.D] = border_style.rlud
+    chars[_Con.R | _Con.L | _Con.D] = border_style.rld
+    chars[_Con.R | _Con.U | _Con.D] = border_style.rud
+    chars[_Con.L | _Con.U | _Con.D] = border_style.lud
+    chars[_Con.R | _Con.L | _Con.U] = border_style.rlu
+    chars[_Con.U | _Con.D] = border_style.ud
+    chars[_Con.R | _Con.L] = border_style.rl
+    chars[_Con.R | _Con.D] = border_style.rd
+    chars[_Con.L | _Con.D] = border_style.ld
+    chars[_Con.R | _Con.U] = border_style.ru
+    chars[_Con.L | _Con.U] = border_style.lu
+    return chars
+
+
 def _halign_middle(s: str) -> str:
     lines = s.split("\n")
-    width = max([len(l) for l in lines])
-    return "\n".join([l.center(width) for l in lines])
+    width = max([_str_width(l) for l in lines])
+    return "\n".join([_center(l, width) for l in lines])
 
 
 def _halign_right(s: str) -> str:
     lines = s.split("\n")
-    width = max([len(l) for l in lines])
-    return "\n".join([l.rjust(width) for l in lines])
+    width = max([_str_width(l) for l in lines])
+    return "\n".join([_rjust(l, width) for l in lines])
+
+
+def _offsets(sizes: list[int]) -> list[int]:
+    offsets = [0]
+    for size in sizes:
+        offsets.append(offsets[-1] + size)
+    return offsets
+
+
+def _extent(offsets: list[int], start: int, span: int) -> tuple[int, int]:
+    end = min(start + span, len(offsets) - 1)
+    return offsets[start], offsets[end] - offsets[start]
+
+
+def _grow(
+    row_sizes: list[int],
+    col_sizes: list[int],
+    span: _Point,
+    r: int,
+    c: int,
+    size: _Point,
+) -> None:
+    if span.x > 0:
+        col_sizes[c:c + span.x] = _divvy(size.x, col_sizes[c:c + span.x])
+    if span.y > 0:
+        row_sizes[r:r + span.y] = _divvy(size.y, row_sizes[r:r + span.y])
+
+
+def _style_key(s: Stylable) -> tuple[_Any, ...]:
+    key: list[_Any] = []
+    for f in _Style._fields:
+        v = getattr(s, f)
+        if v is not None and hasattr(v, "l"):
+            v = (v.l, v.t, v.r, v.b)
+        key.append(v)
+    return tuple(key)
 
 
 def _divvy(size: int, sizes: list[int]) -> list[int]:
@@ -56,6 +261,9 @@ class Cel(Stylable):
     """Represents a single cell within a table
     """
 
+    _placeholder = False
+    """Whether the cel was created from a `None`, see `_Occupancy`"""
+
     def __init__(
             self,
             value: _Any = "",
@@ -64,7 +272,7 @@ class Cel(Stylable):
     ) -> None:
         """
         Args:
-            value: The value displayed by the cel. Will be converted to a string with `str()`.
+            value: The value displayed by the cel. Will be converted to a string with `str()`, or the `Formatter` of its `Col`.
             span: The number of cols/rows the cel spans.
         
         Keyword Args:
@@ -72,21 +280,47 @@ class Cel(Stylable):
             border (int, int*2, int*4): Whether to display the border on each side (l, t, r, b)
             halign ("left", "middle", "right"): The horizontal alignment of the content
             valign ("top", "middle", "bottom"): The vertical alignment of the content
+            fg (Color): The foreground color of the content
+            bg (Color): The background color inside the border
+            bold (bool): Whether the content is bold
+            border_fg (Color): The foreground color of the border
         """
         super().__init__(style)
         self.value = value
-        """The value the cell will display"""
         self.span = _Point(*span)
         """The number of (cols, rows) the cell spans"""
 
+    @property
+    def value(self) -> _Any:
+        """The value the cell will display"""
+        return self._value
+
+    @value.setter
+    def value(self, value: _Any) -> None:
+        self._value = value
+        self._text: _Optional[str] = None
+        self._formatted: _Optional[str] = None
+
+    def _value_str(self) -> str:
+        if self._formatted is not None:
+            # set by the `Formatter` of the cel's col in each sizing pass
+            return self._formatted
+        if self._text is None:
+            # nested tables are embedded without their escape sequences
+            if isinstance(self.value, Table):
+                self._text = str(self.value.grid)
+            else:
+                self._text = str(self.value)
+        return self._text
+
     def get_min_size(self, table: Table, row: Row) -> _Point:
         bw = table.border_style.w
         bh = table.border_style.h
-        s = str(self.value)
+        s = self._value_str()
         lines = s.split("\n")
         w, h = 0, len(lines)
         for l in lines:
-            w = max(len(l), w)
+            w = max(_str_width(l), w)
         return _Point(
             w + self.cascaded_style.padding.l + self.cascaded_style.padding.r +
             int(self.cascaded_style.border.l or self.cascaded_style.border.r) *
@@ -99,35 +333,12 @@ class Cel(Stylable):
     def render(
         self,
         grid: _Grid[str],
-        b_grid: _Grid[_Con],
         table: Table,
     ) -> None:
         bw = table.border_style.w
         bh = table.border_style.h
-        if bh > 0:
-            if self.cascaded_style.border.t:
-                if b_grid.width > 2:
-                    b_grid[1:-1, :bh] |= _Con.L | _Con.R
-                b_grid[0, :bh] |= _Con.R
-                b_grid[-1, :bh] |= _Con.L
-            if self.cascaded_style.border.b:
-                if b_grid.width > 2:
-                    b_grid[1:-1, -bh:] |= _Con.L | _Con.R
-                b_grid[0, -bh:] |= _Con.R
-                b_grid[-1, -bh:] |= _Con.L
-        if bw > 0:
-            if self.cascaded_style.border.l:
-                if b_grid.height > 2:
-                    b_grid[:bw, 1:-1] |= _Con.U | _Con.D
-                b_grid[:bw, 0] |= _Con.D
-                b_grid[:bw, -1] |= _Con.U
-            if self.cascaded_style.border.r:
-                if b_grid.height > 2:
-                    b_grid[-bw:, 1:-1] |= _Con.U | _Con.D
-                b_grid[-bw:, 0] |= _Con.D
-                b_grid[-bw:, -1] |= _Con.U
-
-        s = str(self.value)
+
+        s = self._value_str()
         if self.cascaded_style.halign == "middle":
             s = _halign_middle(s)
         elif self.cascaded_style.halign == "right":
@@ -149,8 +360,127 @@ class Cel(Stylable):
         elif self.cascaded_style.valign == "bottom":
             y = grid.height - v.height - self.cascaded_style.padding.b - bh
 
+        x, y = max(x, 0), max(y, 0)
+        if x + v.width > grid.width or y + v.height > grid.height:
+            # the cel was cut short (e.g. by a page edge), so clip the content
+            v = v[:max(grid.width - x, 0), :max(grid.height - y, 0)].copy()
+            if v.width == 0 or v.height == 0:
+                return
         grid[x, y] = v
 
+    def _add_borders(
+        self,
+        borders: _Borders,
+        pos: _Point,
+        size: _Point,
+        table: Table,
+    ) -> None:
+        bw = table.border_style.w
+        bh = table.border_style.h
+        border = self.cascaded_style.border
+        x, y = pos
+        w, h = size
+        for i in range(bh):
+            if border.t:
+                borders.add_h(y + i, x, x + w - 1)
+            if border.b:
+                borders.add_h(y + h - bh + i, x, x + w - 1)
+        for i in range(bw):
+            if border.l:
+                borders.add_v(x + i, y, y + h - 1)
+            if border.r:
+                borders.add_v(x + w - bw + i, y, y + h - 1)
+
+    def _paint_attrs(
+        self,
+        attrs: _Attrs,
+        pos: _Point,
+        size: _Point,
+        table: Table,
+    ) -> None:
+        style = self.cascaded_style
+        if (style.fg is None and style.bg is None and not style.bold
+                and style.border_fg is None):
+            return
+        bw = table.border_style.w
+        bh = table.border_style.h
+        x, y = pos
+        w, h = size
+        border = style.border
+        attrs.paint(
+            slice(x + bw * border.l, x + w - bw * border.r),
+            slice(y + bh * border.t, y + h - bh * border.b),
+            _Attr(style.fg, style.bg, bool(style.bold)),
+        )
+        if style.border_fg is None:
+            return
+        b_attr = _Attr(style.border_fg)
+        if border.t:
+            attrs.paint(slice(x, x + w), slice(y, y + bh), b_attr)
+        if border.b:
+            attrs.paint(slice(x, x + w), slice(y + h - bh, y + h),
+                        b_attr)
+        if border.l:
+            attrs.paint(slice(x, x + bw), slice(y, y + h), b_attr)
+        if border.r:
+            attrs.paint(slice(x + w - bw, x + w), slice(y, y + h),
+                        b_attr)
+
+
+    def _key(self) -> tuple[_Any, ...]:
+        if isinstance(self.value, Table):
+            value: _Any = self.value.content_key()
+        elif self._formatted is not None:
+            value = self._formatted
+        else:
+            value = str(self.value)
+        return (value, tuple(self.span), self._placeholder, _style_key(self))
+
+
+class Col(Stylable):
+    """Represents a group of columns within a table, like an HTML `<col>`.
+
+    A col's style is cascaded between the `Row`s and the `Table`, so cels
+    inherit it unless they (or their row) override the property.
+    """
+
+    def __init__(
+        self,
+        span: int = 1,
+        format: _Optional[Formatter | _FormatArg] = None,
+        **style: _Unpack[_StyleArg],
+    ) -> None:
+        """
+        Args:
+            span: The number of columns the col applies to.
+            format: The `Formatter` (or format spec) applied to the values in the col's columns.
+
+        Keyword Args:
+            See `Cel`
+        """
+        super().__init__(style)
+        self.span = span
+        """The number of columns the col applies to"""
+        self.format = (format if format is None
+                       or isinstance(format, Formatter) else Formatter(format))
+        """The formatter applied to the values in the col's columns"""
+
+    def _resolve(self, table: Table) -> Stylable:
+        """Returns the col's style cascaded from `table`, used as the parent
+        of every cel in the col's columns.
+        """
+        self._cascade_style(table)
+        resolved = Stylable({})
+        for k, v in self.cascaded_style._asdict().items():
+            setattr(resolved, k, v)
+        return resolved
+
+
+def _placeholder() -> Cel:
+    cel = Cel(padding=0, border=0)
+    cel._placeholder = True
+    return cel
+
 
 _cel = _Any
 
@@ -173,31 +503,278 @@ class Row(Stylable, _UserList[Cel]):
             border (int, int*2, int*4): Whether to display the border on each side (l, t, r, b)
             halign ("left", "middle", "right"): The horizontal alignment of the content
             valign ("top", "middle", "bottom"): The vertical alignment of the content
+            fg (Color): The foreground color of the content
+            bg (Color): The background color inside the border
+            bold (bool): Whether the content is bold
+            border_fg (Color): The foreground color of the border
         """
         cels = [
             c if isinstance(c, Cel) else
-            Cel(padding=0, border=0) if c is None else Cel(c) for c in data
+            _placeholder() if c is None else Cel(c) for c in data
         ]
         super().__init__(style, cels)
 
-    def render(
+    def _slots(self) -> list[tuple[_Point, bool]]:
+        """The span of each cel, and whether it's a placeholder
+        """
+        return [(cel.span, cel._placeholder) for cel in self]
+
+    def _min_sizes(self, table: Table) -> list[_Point]:
+        return [cel.get_min_size(table, self) for cel in self]
+
+    def _cascade_styles(self, table: Table, parents: list[Stylable]) -> None:
+        for cel, parent in zip(self, parents):
+            cel._cascade_style(self, parent)
+
+    def _key(self) -> tuple[_Any, ...]:
+        return (_style_key(self), tuple(cel._key() for cel in self))
+
+
+class _Columns:
+    """The values of a columnar table, converted to strings and measured
+    a column at a time.
+    """
+
+    def __init__(
+        self,
+        columns: _Sequence[_Sequence[_Any]],
+        styles: _Sequence[_Optional[_StyleArg]],
+    ) -> None:
+        self.height = max([len(col) for col in columns], default=0)
+        self.styles: list[_StyleArg] = [
+            styles[i] or {} if i < len(styles) else {}
+            for i in range(len(columns))
+        ]
+        self.stylables = [Stylable(style) for style in self.styles]
+        self._deltas_key: tuple[_Any, ...] = ()
+        self._deltas: list[tuple[int, int]] = []
+        self.columns = columns
+        """The raw values of each column"""
+        self.formatted: list[_Optional[list[_Optional[str]]]] = [
+            None for _ in columns
+        ]
+        """The texts of each column given by `Formatter`s, see `set_formatted`"""
+        self.values: list[list[str]] = []
+        self.widths: list[list[int]] = []
+        self.heights: list[_Optional[list[int]]] = []
+        for c in range(len(columns)):
+            self.values.append([])
+            self.widths.append([])
+            self.heights.append(None)
+            self._measure(c)
+
+    def value(self, c: int, r: int) -> _Any:
+        col = self.columns[c]
+        return col[r] if r < len(col) else None
+
+    def set_formatted(
+        self,
+        c: int,
+        formatted: _Optional[list[_Optional[str]]],
+    ) -> None:
+        """Sets the texts given by the `Formatter` of column `c` (`None` for
+        the values displayed as is), and re-measures it.
+        """
+        if formatted is None and self.formatted[c] is None:
+            return
+        self.formatted[c] = formatted
+        self._measure(c)
+
+    def _measure(self, c: int) -> None:
+        col = self.columns[c]
+        formatted = self.formatted[c] or [None] * len(col)
+        values = [
+            text if text is not None else
+            v if isinstance(v, str) else "" if v is None else str(v)
+            for v, text in zip(col, formatted)
+        ]
+        values.extend([""] * (self.height - len(values)))
+        self.values[c] = values
+        if any("\n" in v for v in values):
+            lines = [v.split("\n") for v in values]
+            self.widths[c] = [max(map(_str_width, l)) for l in lines]
+            self.heights[c] = [len(l) for l in lines]
+        else:
+            self.widths[c] = list(map(_str_width, values))
+            self.heights[c] = None
+
+    @property
+    def width(self) -> int:
+        return len(self.values)
+
+    def min_sizes(
         self,
-        grid: _Grid[str],
-        b_grid: _Grid[_Con],
         table: Table,
-        rc_sizes: _RCSizes,
+        row: Row,
         r: int,
-    ) -> None:
+        parents: list[Stylable],
+    ) -> list[_Point]:
+        key = (row.padding, row.border, table.padding, table.border,
+               table.border_style.w, table.border_style.h, parents)
+        if key != self._deltas_key:
+            self._deltas_key = key
+            self._deltas = self._get_deltas(table, row, parents)
+        return [
+            _Point(
+                self.widths[c][r] + dx,
+                (heights[r] if heights else 1) + dy,
+            ) for c, ((dx, dy), heights) in enumerate(
+                zip(self._deltas, self.heights))
+        ]
+
+    def _get_deltas(
+        self,
+        table: Table,
+        row: Row,
+        parents: list[Stylable],
+    ) -> list[tuple[int, int]]:
         bw = table.border_style.w
         bh = table.border_style.h
-        c = 0
-        for cel in self:
-            w = sum(rc_sizes.cols[c:c + cel.span.x]) + bw
-            h = sum(rc_sizes.rows[r:r + cel.span.y]) + bh
-            x = sum(rc_sizes.cols[:c])
-            y = sum(rc_sizes.rows[:r])
-            cel.render(grid[x:x + w, y:y + h], b_grid[x:x + w, y:y + h], table)
-            c += cel.span.x
+        deltas: list[tuple[int, int]] = []
+        for col, parent in zip(self.stylables, parents):
+            padding = col.padding or row.padding or parent.padding
+            border = col.border or row.border or parent.border
+            assert padding is not None and border is not None
+            deltas.append((
+                padding.l + padding.r + int(border.l or border.r) * bw,
+                padding.t + padding.b + int(border.t or border.b) * bh,
+            ))
+        return deltas
+
+    def cels_key(self, r: int) -> tuple[_Any, ...]:
+        """The `Cel._key()` of each cel in row `r`, without creating them
+        """
+        if not hasattr(self, "_style_keys"):
+            self._style_keys = [_style_key(s) for s in self.stylables]
+        return tuple((values[r], (1, 1), False, key)
+                     for values, key in zip(self.values, self._style_keys))
+
+    def cels(self, r: int) -> list[Cel]:
+        cels: list[Cel] = []
+        for c, style in enumerate(self.styles):
+            v = self.value(c, r)
+            cel = Cel("" if v is None else v, **style)
+            formatted = self.formatted[c]
+            if formatted is not None:
+                cel._formatted = formatted[r]
+            cels.append(cel)
+        return cels
+
+
+class _ColumnarRow(Row):
+    """A `Row` of a columnar table, whose `Cel`s are only created once
+    something accesses them.
+    """
+
+    def __init__(self, columns: _Columns, r: int) -> None:
+        super().__init__()
+        self._columns = columns
+        self._r = r
+        self._cels: _Optional[list[Cel]] = None
+        self._table: _Optional[Table] = None
+        self._parents: list[Stylable] = []
+
+    @property
+    def data(self) -> list[Cel]:  # type: ignore
+        if self._cels is None:
+            self._cels = self._columns.cels(self._r)
+            if self._table is not None:
+                super()._cascade_styles(self._table, self._parents)
+        return self._cels
+
+    @data.setter
+    def data(self, data: list[Cel]) -> None:  # type: ignore
+        self._cels = data
+
+    def _slots(self) -> list[tuple[_Point, bool]]:
+        if self._cels is None:
+            return [(_Point(1, 1), False)] * self._columns.width
+        return super()._slots()
+
+    def _min_sizes(self, table: Table) -> list[_Point]:
+        if self._cels is None:
+            return self._columns.min_sizes(table, self, self._r,
+                                           self._parents)
+        return super()._min_sizes(table)
+
+    def _cascade_styles(self, table: Table, parents: list[Stylable]) -> None:
+        if self._cels is None:
+            # cascaded once the cels are created
+            self._table = table
+            self._parents = parents
+            return
+        super()._cascade_styles(table, parents)
+
+    def _key(self) -> tuple[_Any, ...]:
+        if self._cels is None:
+            return (_style_key(self), self._columns.cels_key(self._r))
+        return super()._key()
+
+
+class _Placement(_NamedTuple):
+    c: int
+    """The first col of the cel"""
+    r: int
+    """The first row of the cel"""
+    i: int
+    """The index of the cel within its row"""
+    span: _Point
+    """The number of (cols, rows) the cel spans"""
+    placed: bool = True
+    """Whether the cel owns its slots (`False` for a placeholder)"""
+
+
+class _Occupancy:
+    """Maps every (col, row) slot of a table to the cel that owns it, as in
+    the HTML table model.
+
+    Cels are placed in order, each in the first free slot of its row, so
+    slots claimed by a row span from above are skipped over. A `None` cel
+    landing on a claimed slot is a placeholder: it's left unplaced, but its
+    (blank) contents still size the slot.
+    """
+
+    def __init__(self, table: Table) -> None:
+        self.rows: list[list[_Placement]] = []
+        """The placement of each cel, by row and index"""
+        self.spanned: dict[tuple[int, int], _Placement] = {}
+        """The owners of the slots claimed from a row above"""
+        width, claimed = 0, 0
+        spanned = self.spanned
+        for r, row in enumerate(table):
+            placements: list[_Placement] = []
+            c = 0
+            for i, (span, placeholder) in enumerate(row._slots()):
+                # only rows before `claimed` have slots claimed from above
+                if r < claimed and (c, r) in spanned:
+                    if placeholder:
+                        placements.append(_Placement(c, r, i, span, False))
+                        c += 1
+                        continue
+                    while (c, r) in spanned:
+                        c += 1
+                p = _Placement(c, r, i, span)
+                placements.append(p)
+                if span.y > 1:
+                    claimed = max(claimed, r + span.y)
+                    for y in range(r + 1, r + span.y):
+                        for x in range(c, c + span.x):
+                            spanned[x, y] = p
+                c += span.x
+            width = max(width, c)
+            self.rows.append(placements)
+        self.size = _Point(width, max(len(table), claimed))
+        """The size of the table in (cols, rows)"""
+
+    def entering(self, r: int) -> list[_Placement]:
+        """The placements from rows above spanning into row `r`
+        """
+        entering: dict[_Placement, None] = {}
+        for c in range(self.size.x):
+            p = self.spanned.get((c, r))
+            if p is not None:
+                entering[p] = None
+        return list(entering)
 
 
 _row = Row | list[_cel] | None
@@ -210,19 +787,27 @@ class Table(Stylable, _UserList[Row]):
     def __init__(
         self,
         *data: _row,
+        cols: _Sequence[Col] = (),
         border_style: _BorderStyle = _BOX_STYLE,
+        sparse: bool = False,
         **style: _Unpack[_StyleArg],
     ) -> None:
         """
         Args:
             data: The rows within the table
+            cols: The column groups, whose styles cascade between the rows and the table
             border_style: The set of characters used to draw borders
+            sparse: Whether to render onto a `SparseGrid`, which only allocates the non-blank runs of each line
         
         Keyword Args:
             padding (int, int*2, int*4): The amount of interior padding applied to each side (l, t, r, b)
             border (int, int*2, int*4): Whether to display the border on each side (l, t, r, b)
             halign ("left", "middle", "right"): The horizontal alignment of the content
             valign ("top", "middle", "bottom"): The vertical alignment of the content
+            fg (Color): The foreground color of the content
+            bg (Color): The background color inside the border
+            bold (bool): Whether the content is bold
+            border_fg (Color): The foreground color of the border
         """
 
         rows: list[Row] = []
@@ -234,26 +819,117 @@ class Table(Stylable, _UserList[Row]):
             else:
                 rows.append(Row(*row))
         super().__init__(style, rows)
+        self.cols = list(cols)
+        """The column groups of the table"""
         self.border_style = border_style
+        self.sparse = sparse
 
         self.border = self.border or _Border(1)
         self.padding = self.padding or _Padding(3, 0)
         self.halign = self.halign or "left"
         self.valign = self.valign or "top"
 
+    @classmethod
+    def from_columns(
+        cls,
+        *columns: _Sequence[_Any],
+        header: _Optional[_Sequence[_Any]] = None,
+        styles: _Sequence[_Optional[_StyleArg]] = (),
+        cols: _Sequence[Col] = (),
+        border_style: _BorderStyle = _BOX_STYLE,
+        sparse: bool = False,
+        **style: _Unpack[_StyleArg],
+    ) -> Table:
+        """Creates a table from columns of values.
+
+        Values are converted to strings and measured a column at a time, and
+        `Cel`s are only created for the rows that are rendered or accessed.
+        `None` values and the ends of short columns are left blank.
+
+        Args:
+            columns: The values of each column (any sequence, e.g. a `list` or `array`)
+            header: The values of a header row added above the columns
+            styles: The style of the cels in each column
+            cols: The column groups of the table
+            border_style: The set of characters used to draw borders
+            sparse: Whether to render onto a `SparseGrid`
+
+        Keyword Args:
+            See `Table`
+        """
+        store = _Columns(columns, styles)
+        rows: list[_row] = [
+            _ColumnarRow(store, r) for r in range(store.height)
+        ]
+        if header is not None:
+            rows.insert(0, Row(*header))
+        return cls(
+            *rows,
+            cols=cols,
+            border_style=border_style,
+            sparse=sparse,
+            **style,
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: _Iterable[_Sequence[_Any] | _Mapping[str, _Any]],
+        fields: _Optional[_Sequence[str]] = None,
+        header: _Optional[_Sequence[_Any]] = None,
+        styles: _Sequence[_Optional[_StyleArg]] = (),
+        cols: _Sequence[Col] = (),
+        border_style: _BorderStyle = _BOX_STYLE,
+        sparse: bool = False,
+        **style: _Unpack[_StyleArg],
+    ) -> Table:
+        """Creates a table from records (e.g. the rows of a query result).
+
+        The records are transposed to columns, see `Table.from_columns`.
+
+        Args:
+            records: Sequences of values, or mappings of field names to values
+            fields: The fields of mapping records to display, defaults to the keys of the first record
+            header: The values of a header row added above the records
+            styles: The style of the cels in each column
+            cols: The column groups of the table
+            border_style: The set of characters used to draw borders
+            sparse: Whether to render onto a `SparseGrid`
+
+        Keyword Args:
+            See `Table`
+        """
+        records = list(records)
+        columns: list[_Sequence[_Any]]
+        if len(records) > 0 and isinstance(records[0], _Mapping):
+            if fields is None:
+                fields = list(records[0].keys())  # type: ignore
+            columns = [
+                [rec.get(f) for rec in records]  # type: ignore
+                for f in fields
+            ]
+        else:
+            columns = list(_zip_longest(*records))  # type: ignore
+        return cls.from_columns(
+            *columns,
+            header=header,
+            styles=styles,
+            cols=cols,
+            border_style=border_style,
+            sparse=sparse,
+            **style,
+        )
+
     @property
     def size(self) -> _Point:
         """The size of the table in (cols, rows)
         """
-        w, h = 0, len(self)
-        for r, row in enumerate(reversed(self)):
-            rw = 0
-            for col in row:
-                rw += col.span.x
-                if col.span.y > (r + 1):
-                    h += col.span.y - (r + 1)
-            w = max(w, rw)
-        return _Point(w, h)
+        return _Occupancy(self).size
+
+    def _get_occupancy(self) -> _Occupancy:
+        if not hasattr(self, "_occupancy"):
+            self._occupancy = _Occupancy(self)
+        return self._occupancy
 
     @property
     def grid(self) -> _Grid[str]:
@@ -263,93 +939,326 @@ class Table(Stylable, _UserList[Row]):
             self._grid = self._render()
         return self._grid
 
+    @property
+    def rc_sizes(self) -> _RCSizes:
+        """The sizes of each row and col, cached until the table is changed
+        """
+        if not hasattr(self, "_rc_sizes"):
+            # the slots are placed afresh for every sizing pass
+            self._occupancy = _Occupancy(self)
+            self._cascade_styles()
+            self._format_cols()
+            self._rc_sizes = self._get_rc_sizes()
+        return self._rc_sizes
+
+    def measure(self) -> Measurement:
+        """Measures the output without rendering it.
+
+        Only the styles are cascaded and the rows / cols sized (which is
+        cached for a later render, until the table is changed), no grids are
+        allocated.
+        """
+        rc_sizes = self.rc_sizes
+        width = sum(rc_sizes.cols) + self.border_style.w
+        height = sum(rc_sizes.rows) + self.border_style.h
+        cels = sum(len(row) for row in self._get_occupancy().rows)
+        if self.sparse:
+            memory = (width * height * _SPARSE_BYTES_PER_CHAR +
+                      height * _SPARSE_BYTES_PER_LINE +
+                      cels * _SPARSE_BYTES_PER_CEL)
+        else:
+            memory = (width * height * _RENDER_BYTES_PER_CHAR +
+                      cels * _RENDER_BYTES_PER_CEL)
+        return Measurement(
+            width,
+            height,
+            list(rc_sizes.cols),
+            list(rc_sizes.rows),
+            memory,
+        )
+
+    def render_page(
+        self,
+        start_row: int,
+        n_rows: int,
+        header_rows: int = 0,
+    ) -> str:
+        """Renders a window of rows, using the col sizes of the whole table.
+
+        Only the cels overlapping the window (or the header) are rendered.
+        Cels spanning across the edge of the window are clipped to it.
+
+        Args:
+            start_row: The first row of the page, counted from the end of the header
+            n_rows: The maximum number of rows on the page
+            header_rows: The number of rows at the top of the table repeated on every page
+        """
+        rc_sizes = self.rc_sizes
+        bw, bh = self.border_style.w, self.border_style.h
+        n = len(rc_sizes.rows)
+        header_rows = min(header_rows, n)
+        start = min(header_rows + max(start_row, 0), n)
+        segments = [
+            range(0, header_rows),
+            range(start, min(start + max(n_rows, 0), n)),
+        ]
+
+        page_rows: list[int] = []
+        page_y: dict[int, int] = {}
+        y = 0
+        for seg in segments:
+            for r in seg:
+                page_y[r] = y
+                y += rc_sizes.rows[r]
+                page_rows.append(rc_sizes.rows[r])
+        col_x = _offsets(rc_sizes.cols)
+        row_y = _offsets(rc_sizes.rows)
+
+        size = (col_x[-1] + bw, sum(page_rows) + bh)
+        grid = self._new_grid(size)
+        borders = _Borders()
+        attrs = _Attrs(size)
+        occupancy = self._get_occupancy()
+        for seg in segments:
+            if len(seg) == 0:
+                continue
+            placements = occupancy.entering(seg.start)
+            for r in range(seg.start, min(seg.stop, len(self))):
+                placements.extend(p for p in occupancy.rows[r] if p.placed)
+            for p in placements:
+                lo = max(p.r, seg.start)
+                hi = min(p.r + p.span.y, seg.stop)
+                if lo >= hi:
+                    continue
+                x, w = _extent(col_x, p.c, p.span.x)
+                y = page_y[lo]
+                h = row_y[hi] - row_y[lo]
+                self._render_cel(self[p.r][p.i], grid, borders, attrs,
+                                 _Point(x, y), _Point(w + bw, h + bh))
+
+        borders.fill(grid, self.border_style)
+        if attrs:
+            return attrs.render(grid)
+        return str(grid)
+
     def _render(self) -> _Grid[str]:
-        self._cascade_styles()
-        grid = _Grid[str]()
-        b_grid = _Grid[_Con]()
-        rc_sizes = self._get_rc_sizes()
+        rc_sizes = self.rc_sizes
         width, height = sum(rc_sizes.cols), sum(rc_sizes.rows)
-        grid = _Grid.full(
-            (width + self.border_style.w, height + self.border_style.h),
-            " ",
-        )
-        b_grid = _Grid.full(
-            (width + self.border_style.w, height + self.border_style.h),
-            _Con.N,
-        )
-        for r, row in enumerate(self):
-            row.render(grid, b_grid, self, rc_sizes, r)
+        grid = self._new_grid(
+            (width + self.border_style.w, height + self.border_style.h))
+        borders = _Borders()
+        self._attrs = _Attrs(grid.size)
+        bw, bh = self.border_style.w, self.border_style.h
+        col_x = _offsets(rc_sizes.cols)
+        row_y = _offsets(rc_sizes.rows)
+        for row, placements in zip(self, self._get_occupancy().rows):
+            for cel, p in zip(row, placements):
+                if not p.placed:
+                    continue
+                x, w = _extent(col_x, p.c, p.span.x)
+                y, h = _extent(row_y, p.r, p.span.y)
+                self._render_cel(cel, grid, borders, self._attrs,
+                                 _Point(x, y), _Point(w + bw, h + bh))
 
-        self._fill_borders(grid, b_grid)
+        borders.fill(grid, self.border_style)
         return grid
 
+    def _render_cel(
+        self,
+        cel: Cel,
+        grid: _Grid[str],
+        borders: _Borders,
+        attrs: _Attrs,
+        pos: _Point,
+        size: _Point,
+    ) -> None:
+        x, y = pos
+        cel.render(grid[x:x + size.x, y:y + size.y], self)
+        cel._add_borders(borders, pos, size, self)
+        cel._paint_attrs(attrs, pos, size, self)
+
+    def _new_grid(self, size: _PointArg) -> _Grid[str]:
+        if self.sparse:
+            return _Grid[str].sparse(size, " ")
+        return _Grid[str].full(size, " ")
+
     def _get_rc_sizes(self) -> _RCSizes:
-        w, h = self.size
+        w, h = self._get_occupancy().size
         row_sizes, col_sizes = [0] * h, [0] * w
-        cels = [(r, c, row, cel) for r, row in enumerate(self)
-                for c, cel in enumerate(row)]
-
-        cels.sort(key=lambda t: t[3].span)
-        for r, c, row, cel in cels:
-            size = cel.get_min_size(self, row)
-            if cel.span.x > 0:
-                col_sizes[c:c + cel.span.x] = _divvy(
-                    size.x, col_sizes[c:c + cel.span.x])
-            if cel.span.y > 0:
-                row_sizes[r:r + cel.span.y] = _divvy(
-                    size.y, row_sizes[r:r + cel.span.y])
+        one_rows, one_cols = [0] * h, [0] * w
+        spanned: list[tuple[_Point, int, int, _Point]] = []
+        for row, placements in zip(self, self._get_occupancy().rows):
+            for p, size in zip(placements, row._min_sizes(self)):
+                if p.span == (1, 1):
+                    if size.x > one_cols[p.c]:
+                        one_cols[p.c] = size.x
+                    if size.y > one_rows[p.r]:
+                        one_rows[p.r] = size.y
+                else:
+                    spanned.append((p.span, p.r, p.c, size))
+
+        # cels are sized from the smallest span to the largest, so spanning
+        # cels only grow the rows / cols their contents don't already fit
+        spanned.sort(key=lambda t: t[0])
+        n_small = _bisect_left(spanned, (1, 1), key=lambda t: t[0])
+        for span, r, c, size in spanned[:n_small]:
+            _grow(row_sizes, col_sizes, span, r, c, size)
+        row_sizes = list(map(max, row_sizes, one_rows))
+        col_sizes = list(map(max, col_sizes, one_cols))
+        for span, r, c, size in spanned[n_small:]:
+            _grow(row_sizes, col_sizes, span, r, c, size)
         return _RCSizes(row_sizes, col_sizes)
 
-    def _fill_borders(self, grid: _Grid[str], b_grid: _Grid[_Con]) -> None:
-        for x in range(grid.width):
-            for y in range(grid.height):
-                con = b_grid[x, y].item()
-                if con == (_Con.R | _Con.L | _Con.U | _Con.D):
-                    grid[x, y] = self.border_style.rlud
-                    continue
-                if con == (_Con.R | _Con.L | _Con.D):
-                    grid[x, y] = self.border_style.rld
-                    continue
-                if con == (_Con.R | _Con.U | _Con.D):
-                    grid[x, y] = self.border_style.rud
-                    continue
-                if con == (_Con.L | _Con.U | _Con.D):
-                    grid[x, y] = self.border_style.lud
-                    continue
-                if con == (_Con.R | _Con.L | _Con.U):
-                    grid[x, y] = self.border_style.rlu
-                    continue
-                if con == (_Con.U | _Con.D):
-                    grid[x, y] = self.border_style.ud
-                    continue
-                if con == (_Con.R | _Con.L):
-                    grid[x, y] = self.border_style.rl
-                    continue
-                if con == (_Con.R | _Con.D):
-                    grid[x, y] = self.border_style.rd
-                    continue
-                if con == (_Con.L | _Con.D):
-                    grid[x, y] = self.border_style.ld
-                    continue
-                if con == (_Con.R | _Con.U):
-                    grid[x, y] = self.border_style.ru
-                    continue
-                if con == (_Con.L | _Con.U):
-                    grid[x, y] = self.border_style.lu
-                    continue
-                if con & (_Con.R | _Con.L):
-                    grid[x, y] = self.border_style.rl
+    def _cascade_styles(self) -> None:
+        col_styles: list[Stylable] = []
+        for col in self.cols:
+            col_styles.extend([col._resolve(self)] * col.span)
+        width = self._get_occupancy().size.x
+        col_styles = col_styles[:width]
+        col_styles.extend([self] * (width - len(col_styles)))
+        for row, placements in zip(self, self._get_occupancy().rows):
+            parents = col_styles
+            if any(p.c != i for i, p in enumerate(placements)):
+                parents = [col_styles[p.c] for p in placements]
+            row._cascade_styles(self, parents)
+
+    def _format_cols(self) -> None:
+        formats: list[_Optional[Formatter]] = []
+        for col in self.cols:
+            formats.extend([col.format] * col.span)
+        # the values of each formatted col, and where their texts go
+        values: list[list[_Any]] = [[] for _ in formats]
+        targets: list[list[Cel | tuple[_Columns, int, int]]] = [
+            [] for _ in formats
+        ]
+        stores: dict[int, _Columns] = {}
+        any_format = any(formats)
+        for row, placements in zip(self, self._get_occupancy().rows):
+            columnar = (row if isinstance(row, _ColumnarRow)
+                        and row._cels is None else None)
+            if columnar is not None:
+                stores[id(columnar._columns)] = columnar._columns
+            else:
+                for cel in row:
+                    cel._formatted = None
+            if not any_format:
+                continue
+            for i, p in enumerate(placements):
+                if (not p.placed or p.c >= len(formats)
+                        or formats[p.c] is None or p.span.x != 1):
                     continue
-                if con & (_Con.U | _Con.D):
-                    grid[x, y] = self.border_style.ud
+                if columnar is not None:
+                    store, r = columnar._columns, columnar._r
+                    values[p.c].append(store.value(i, r))
+                    targets[p.c].append((store, i, r))
+                else:
+                    values[p.c].append(row[i].value)
+                    targets[p.c].append(row[i])
+
+        formatted: dict[tuple[int, int], list[_Optional[str]]] = {}
+        for fmt, col_values, col_targets in zip(formats, values, targets):
+            if fmt is None:
+                continue
+            texts = fmt.format_column(col_values)
+            for target, text in zip(col_targets, texts):
+                if isinstance(target, Cel):
+                    target._formatted = text
                     continue
-                if con > 0:
-                    grid[x, y] = str(con.value)
+                store, i, r = target
+                if (id(store), i) not in formatted:
+                    formatted[id(store), i] = [None] * store.height
+                formatted[id(store), i][r] = text
+        for store in stores.values():
+            for i in range(store.width):
+                store.set_formatted(i, formatted.get((id(store), i)))
 
-    def _cascade_styles(self) -> None:
-        for row in self:
-            for cel in row:
-                cel._cascade_style(row, self)
+    def content_key(self) -> tuple[_Any, ...]:
+        """A key of the content and styles of the table (and its
+        `BorderStyle`), equal for tables that render the same.
+
+        The values of formatted cols are keyed by their formatted texts.
+        """
+        self._format_cols()
+        return (
+            _style_key(self),
+            tuple((col.span, _style_key(col)) for col in self.cols),
+            _astuple(self.border_style),
+            tuple(row._key() for row in self),
+        )
+
+    def invalidate(self) -> None:
+        """Clears the cached sizes and rendering.
+
+        This is done whenever the rows or attributes of the table are
+        changed, but must be called after editing a `Row` or `Cel` in place.
+        """
+        for name in ("_grid", "_attrs", "_rc_sizes", "_occupancy"):
+            self.__dict__.pop(name, None)
+
+    def __setattr__(self, name: str, value: _Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate()
+
+    def __setitem__(self, i: _Any, item: _Any) -> None:
+        super().__setitem__(i, item)
+        self.invalidate()
+
+    def __delitem__(self, i: _Any) -> None:
+        super().__delitem__(i)
+        self.invalidate()
+
+    def __iadd__(self, other: _Iterable[Row]) -> Table:  # type: ignore
+        super().__iadd__(other)
+        self.invalidate()
+        return self
+
+    def __imul__(self, n: int) -> Table:  # type: ignore
+        super().__imul__(n)
+        self.invalidate()
+        return self
+
+    def append(self, item: Row) -> None:
+        super().append(item)
+        self.invalidate()
+
+    def insert(self, i: int, item: Row) -> None:
+        super().insert(i, item)
+        self.invalidate()
+
+    def extend(self, other: _Iterable[Row]) -> None:
+        super().extend(other)
+        self.invalidate()
+
+    def pop(self, i: int = -1) -> Row:
+        row = super().pop(i)
+        self.invalidate()
+        return row
+
+    def remove(self, item: Row) -> None:
+        super().remove(item)
+        self.invalidate()
+
+    def clear(self) -> None:
+        super().clear()
+        self.invalidate()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.invalidate()
+
+    def sort(self, *args: _Any, **kwds: _Any) -> None:
+        super().sort(*args, **kwds)
+        self.invalidate()
+
+    @property
+    def attrs(self) -> _Attrs:
+        """The run-length encoded display attributes of the rendered grid
+        """
+        self.grid
+        return self._attrs
 
     def __str__(self) -> str:
+        if self.attrs:
+            return self.attrs.render(self.grid)
         return str(self.grid)
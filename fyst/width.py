@@ -0,0 +1,110 @@
+from __future__ import annotations as _annotations
+
+from functools import lru_cache as _lru_cache
+from unicodedata import category as _category
+from unicodedata import east_asian_width as _east_asian_width
+
+_WIDTHS: dict[str, int] = {chr(i): 1 for i in range(0x20, 0x7f)}
+"""Display widths of every character seen so far, seeded with printable ASCII.
+"""
+
+
+def char_width(c: str) -> int:
+    """The number of terminal columns taken by a single character.
+
+    Combining marks and format characters take 0 columns, east asian
+    wide / fullwidth characters take 2, everything else takes 1.
+    """
+    w = _WIDTHS.get(c)
+    if w is not None:
+        return w
+    if _category(c) in ("Mn", "Me", "Cf"):
+        w = 0
+    elif _east_asian_width(c) in ("W", "F"):
+        w = 2
+    else:
+        w = 1
+    _WIDTHS[c] = w
+    return w
+
+
+@_lru_cache(maxsize=4096)
+def _str_width(s: str) -> int:
+    return sum(char_width(c) for c in s)
+
+
+def str_width(s: str) -> int:
+    """The number of terminal columns taken by `s` (which should not contain newlines).
+    """
+    if s.isascii():
+        return len(s)
+    return _str_width(s)
+
+
+def str_cells(s: str) -> list[str]:
+    """Splits `s` into one string per terminal column.
+
+    Zero width characters are attached to the preceding cell (or the
+    following one, at the start of `s`), and wide characters are followed by
+    an empty string so they take two cells. So `len(str_cells(s))` is always
+    `str_width(s)`.
+    """
+    if s.isascii():
+        return list(s)
+    cells: list[str] = []
+    prefix = ""
+    for c in s:
+        w = char_width(c)
+        if w == 0:
+            if len(cells) > 0:
+                cells[-1 if cells[-1] != "" else -2] += c
+            else:
+                prefix += c
+            continue
+        cells.append(prefix + c)
+        prefix = ""
+        if w == 2:
+            cells.append("")
+    return cells
+
+
+def center(s: str, width: int) -> str:
+    """`str.center` using display width."""
+    if s.isascii():
+        return s.center(width)
+    marg = width - str_width(s)
+    if marg <= 0:
+        return s
+    left = marg // 2 + (marg & width & 1)
+    return " " * left + s + " " * (marg - left)
+
+
+def rjust(s: str, width: int) -> str:
+    """`str.rjust` using display width."""
+    if s.isascii():
+        return s.rjust(width)
+    return " " * max(width - str_width(s), 0) + s
+
+
+def ljust(s: str, width: int) -> str:
+    """`str.ljust` using display width."""
+    if s.isascii():
+        return s.ljust(width)
+    return s + " " * max(width - str_width(s), 0)
+
+
+def truncate(s: str, width: int, ellipsis: str = "…") -> str:
+    """Shortens `s` to at most `width` columns, ending it with `ellipsis` if
+    anything was cut off.
+    """
+    if str_width(s) <= width:
+        return s
+    if width <= 0:
+        return ""
+    if str_width(ellipsis) > width:
+        ellipsis = truncate(ellipsis, width, "")
+    cells = str_cells(s)[:width - str_width(ellipsis)]
+    if len(cells) > 0 and str_width(cells[-1]) == 2:
+        # the second half of a wide character was cut off
+        cells[-1] = " "
+    return "".join(cells) + ellipsis
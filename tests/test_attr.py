@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from fyst.attr import Attr, Attrs
+from fyst.grid import Grid
+
+_RED = Attr(fg="red")
+_BLUE_BG = Attr(bg="blue")
+_BOLD = Attr(bold=True)
+
+
+def _expand(attrs: Attrs, y: int) -> list[Attr]:
+    line = [Attr()] * attrs.width
+    for start, stop, a in attrs.lines[y]:
+        line[start:stop] = [a] * (stop - start)
+    return line
+
+
+def _assert_runs(attrs: Attrs) -> None:
+    for runs in attrs.lines:
+        for (_, stop, a), (start, _, b) in zip(runs, runs[1:]):
+            assert stop <= start
+            assert stop < start or a != b
+        for start, stop, a in runs:
+            assert 0 <= start < stop <= attrs.width
+            assert a != Attr()
+
+
+def test_paint() -> None:
+    attrs = Attrs((10, 2))
+    assert not attrs
+    attrs.paint(slice(2, 6), slice(None), _RED)
+    attrs.paint(slice(4, 8), slice(1, 2), _BLUE_BG)
+    attrs.paint(slice(6, 7), slice(None), Attr(fg="red"))
+    attrs.paint(slice(0, 10), slice(0, 1), Attr())
+    assert attrs
+    assert attrs.lines == [
+        [(2, 7, _RED)],
+        [(2, 4, _RED), (4, 7, Attr("red", "blue")), (7, 8, _BLUE_BG)],
+    ]
+
+
+def test_paint_matches_columns() -> None:
+    rand = random.Random(0)
+    palette = [_RED, _BLUE_BG, _BOLD, Attr(fg=3), Attr(fg=(1, 2, 3))]
+    attrs = Attrs((12, 3))
+    model = [[Attr()] * 12 for _ in range(3)]
+    for _ in range(200):
+        x0, x1 = sorted(rand.sample(range(-2, 14), 2))
+        y = rand.randrange(3)
+        attr = rand.choice(palette)
+        attrs.paint(slice(x0, x1), slice(y, y + 1), attr)
+        for x in range(*slice(x0, x1).indices(12)):
+            model[y][x] = model[y][x].merge(attr)
+        assert _expand(attrs, y) == model[y]
+        _assert_runs(attrs)
+
+
+@pytest.mark.parametrize("attr, sgr", [
+    (Attr(), ""),
+    (_RED, "\x1b[31m"),
+    (Attr(fg="bright_red", bg="blue", bold=True), "\x1b[1;91;44m"),
+    (Attr(fg=208), "\x1b[38;5;208m"),
+    (Attr(bg=(1, 2, 3)), "\x1b[48;2;1;2;3m"),
+])
+def test_sgr(attr: Attr, sgr: str) -> None:
+    assert attr.sgr() == sgr
+
+
+def test_render() -> None:
+    grid = Grid.from_str("abcdef\nghijkl")
+    attrs = Attrs(grid.size)
+    attrs.paint(slice(1, 3), slice(0, 1), _RED)
+    attrs.paint(slice(3, 5), slice(0, 1), _BOLD)
+    assert attrs.render(grid) == ("a\x1b[31mbc\x1b[0m\x1b[1mde\x1b[0mf\n"
+                                  "ghijkl")
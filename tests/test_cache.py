@@ -0,0 +1,48 @@
+import os
+from pathlib import Path
+
+from fyst import Cel, Row, Table
+from fyst.cache import RenderCache
+
+
+def _entry(cache: RenderCache, table: Table) -> Path:
+    return next(cache.directory.glob(cache.key(table) + ".*"))
+
+
+def test_hit_and_miss(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path)
+    t = Table(["a", "b"], ["c", "d"])
+    assert cache.get(t) is None
+    assert cache.render(t) == str(t)
+    assert cache.get(t) == str(t)
+    assert cache.get(Table(["a", "b"], ["c", "d"])) == str(t)
+
+    # the rendering is read back from disk
+    _entry(cache, t).write_text("cached", encoding="utf-8")
+    assert cache.render(t) == "cached"
+
+    assert cache.get(Table(["a", "b"], ["c", "e"])) is None
+    assert cache.get(Table(["a", "b"], ["c", "d"], padding=0)) is None
+
+
+def test_key_placeholders(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path)
+    a = Table(Row(Cel("A", span=(1, 2)), "x"), [None, "b"])
+    b = Table(Row(Cel("A", span=(1, 2)), "x"), [Cel(padding=0, border=0), "b"])
+    assert str(a) != str(b)
+    assert cache.key(a) != cache.key(b)
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    tables = [Table([str(i) * 10]) for i in range(3)]
+    size = len(str(tables[0]).encode())
+    cache = RenderCache(tmp_path, max_bytes=size * 2)
+    for i, t in enumerate(tables):
+        cache.render(t)
+        os.utime(_entry(cache, t), (i, i))
+    assert cache.get(tables[0]) is None
+    assert cache.get(tables[1]) == str(tables[1])
+    assert cache.get(tables[2]) == str(tables[2])
+
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
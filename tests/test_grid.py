@@ -0,0 +1,139 @@
+from typing import Any, Callable
+
+import pytest
+
+from fyst import Cel, Row, Table
+from fyst.grid import Grid
+
+_ASSIGNMENTS: list[tuple[Any, Any]] = [
+    ((2, 1), "x"),
+    ((slice(1, 4), 2), "x"),
+    ((slice(None, None, 2), slice(None, None, 3)), "o"),
+    ((-1, -1), "z"),
+    (slice(5, 7), "|"),
+    ((slice(0, 2), slice(0, 3)), Grid.from_str("ab")),
+    ((slice(3, 4), slice(1, 4)), Grid.from_str("a\nb\nc")),
+    ((2, 3), Grid.from_str("xy\nzw")),
+]
+
+
+def _fill(g: Grid[str]) -> None:
+    g[1:5, 3:5].fill("-")
+
+
+def _blit(g: Grid[str]) -> None:
+    g[1:-1, 1:-1].blit(Grid.from_str("pq\nrs"), (1, 0))
+
+
+def _blit_clipped(g: Grid[str]) -> None:
+    g[1:-1, 1:-1].blit(Grid.from_str("long\nlong"), (2, 3))
+
+
+def _map(g: Grid[str]) -> None:
+    g[::3, 1:4].map(str.upper)
+
+
+_BULK: list[Callable[[Grid[str]], None]] = [_fill, _blit, _blit_clipped, _map]
+
+
+def _grids() -> tuple[Grid[str], Grid[str]]:
+    dense = Grid[str].full((7, 6), ".")
+    sparse = Grid[str].sparse((7, 6), ".")
+    for g in (dense, sparse):
+        g[::2, ::2] = "#"
+    return dense, sparse
+
+
+def _assert_same(sparse: Grid[str], dense: Grid[str]) -> None:
+    assert str(sparse) == str(dense)
+    assert sparse.size == dense.size
+    assert [sparse.line(y) for y in range(sparse.height)
+            ] == [dense.line(y) for y in range(dense.height)]
+
+
+@pytest.mark.parametrize("pos, value", _ASSIGNMENTS)
+def test_sparse_assignment(pos: Any, value: Any) -> None:
+    dense, sparse = _grids()
+    dense[pos] = value
+    sparse[pos] = value
+    _assert_same(sparse, dense)
+
+
+@pytest.mark.parametrize("op", _BULK)
+def test_sparse_bulk(op: Callable[[Grid[str]], None]) -> None:
+    dense, sparse = _grids()
+    op(dense)
+    op(sparse)
+    _assert_same(sparse, dense)
+
+
+def test_sparse_views() -> None:
+    dense, sparse = _grids()
+    for g in (dense, sparse):
+        for pos, value in _ASSIGNMENTS:
+            g[pos] = value
+        for op in _BULK:
+            op(g)
+    for view in (
+        (slice(1, -1), slice(1, -1)),
+        (slice(None, None, -1), 2),
+        (4, slice(None)),
+        (slice(2, 6, 2), slice(5, 0, -2)),
+    ):
+        _assert_same(sparse[view], dense[view])
+    assert sparse[3, 4].item() == dense[3, 4].item()
+    _assert_same(sparse.copy(), dense)
+
+
+def _table(sparse: bool) -> Table:
+    return Table(
+        Row(Cel("A\nB", span=(1, 2)), "x", Cel("y", bg="blue")),
+        ["long value", Cel("z", span=(1, 2))],
+        [None, "p", "q", Cel("r", padding=(4, 2), fg="red", border=0)],
+        padding=(1, 0),
+        sparse=sparse,
+    )
+
+
+def test_sparse_table() -> None:
+    dense, sparse = _table(False), _table(True)
+    assert str(sparse) == str(dense)
+    assert (sparse.render_page(1, 1, header_rows=1) ==
+            dense.render_page(1, 1, header_rows=1))
+
+
+@pytest.mark.parametrize("pos, value, expected", [
+    ((1, 2), "x", "..... ..... .x... ....."),
+    (2, "|", "..|.. ..|.. ..|.. ..|.."),
+    (-1, "|", "....| ....| ....| ....|"),
+    (slice(1, 3), "|", ".||.. .||.. .||.. .||.."),
+    ((slice(None), 1), "-", "..... ----- ..... ....."),
+    ((slice(None, None, 2), slice(1, None, 2)), "o",
+     "..... o.o.o ..... o.o.o"),
+    ((slice(1, 3), slice(0, 4)), Grid.from_str("a\nb\nc\nd"),
+     ".aa.. .bb.. .cc.. .dd.."),
+    ((slice(0, 3), 2), Grid.from_str("abc"), "..... ..... abc.. ....."),
+    (slice(0, 2), Grid.from_str("a\nb\nc\nd"), "aa... bb... cc... dd..."),
+    ((1, 1), Grid.from_str("ab\ncd"), "..... .ab.. .cd.. ....."),
+    ((-2, -2), Grid.from_str("ab\ncd"), "..... ..... ...ab ...cd"),
+])
+def test_broadcast(pos: Any, value: Any, expected: str) -> None:
+    g = Grid[str].full((5, 4), ".")
+    g[pos] = value
+    assert str(g) == expected.replace(" ", "\n")
+
+
+def test_broadcast_view() -> None:
+    g = Grid[str].full((5, 4), ".")
+    g[1:4, 1:3][1, 0] = "x"
+    g[1:4, 1:3][:, 1] = Grid.from_str("abc")
+    assert str(g) == "\n".join([".....", "..x..", ".abc.", "....."])
+
+
+@pytest.mark.parametrize("pos, value", [
+    ((slice(0, 2), 0), Grid.from_str("abc")),
+    (slice(0, 2), Grid.from_str("a\nb")),
+])
+def test_broadcast_mismatch(pos: Any, value: Grid[str]) -> None:
+    with pytest.raises(IndexError):
+        Grid[str].full((5, 4), ".")[pos] = value
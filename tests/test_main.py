@@ -0,0 +1,102 @@
+import io
+
+import pytest
+
+from fyst import Table
+from fyst.__main__ import main
+from fyst.style import BASIC_STYLE
+from fyst.width import ljust
+
+
+def _run(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    data: str,
+    *argv: str,
+) -> tuple[int, str, str]:
+    monkeypatch.setattr("sys.stdin", io.StringIO(data))
+    code = main(argv)
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+_CSV = "id,name\n1,apple\n2,\"pear\nwilliams\"\n3,あい\n4,kiwi\n"
+
+
+@pytest.mark.parametrize("chunk", ["1", "2", "3", "256"])
+def test_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    chunk: str,
+) -> None:
+    code, out, _ = _run(monkeypatch, capsys, _CSV, "--chunk", chunk)
+    assert code == 0
+    assert out == _run(monkeypatch, capsys, _CSV, "--chunk", "1000")[1]
+
+
+def test_matches_table(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    _, out, _ = _run(monkeypatch, capsys, _CSV, "-s", "basic", "-p", "2,1",
+                     "--header-rows", "0", "--chunk", "2")
+    records = [["id", "name"], ["1", "apple"], ["2", "pear williams"],
+               ["3", "あい"], ["4", "kiwi"]]
+    table = Table.from_records(
+        [[ljust(a, 2), ljust(b, 13)] for a, b in records],
+        border_style=BASIC_STYLE,
+        padding=(2, 1),
+    )
+    assert out == str(table) + "\n"
+
+
+@pytest.mark.parametrize("padding", ["1", "1,0", "0,0,1,0"])
+def test_padding(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    padding: str,
+) -> None:
+    code, out, _ = _run(monkeypatch, capsys, "a,b\n1,2\n", "-p", padding)
+    assert code == 0
+    assert "a" in out
+
+
+@pytest.mark.parametrize("padding", ["1,2,3", "1,2,3,4,5"])
+def test_padding_invalid(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    padding: str,
+) -> None:
+    with pytest.raises(SystemExit) as e:
+        _run(monkeypatch, capsys, "a,b\n1,2\n", "-p", padding)
+    assert e.value.code == 2
+    assert "L,T,R,B" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("data, argv, line", [
+    ("a,b\n1,2\n3,4,5,6\n", ("--sample", "2"), 3),
+    ("a,b\n1,2\n\"x\ny\",z\n3,4,5\n", ("--sample", "2"), 5),
+    ("a,b\n1,2\n3,4,5\n", ("--widths", "1,1"), 3),
+    ('{"a": 1}\n\n{"a": 2\n', ("-f", "jsonl"), 3),
+])
+def test_invalid(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    data: str,
+    argv: tuple[str, ...],
+    line: int,
+) -> None:
+    code, _, err = _run(monkeypatch, capsys, data, *argv)
+    assert code == 1
+    assert err.startswith(f"python -m fyst: <stdin>: line {line}: ")
+
+
+def test_skip_invalid(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    code, out, _ = _run(monkeypatch, capsys, "a,b\n1,2\n3,4,5,6\n7,8,,\n",
+                        "--sample", "2", "--skip-invalid")
+    expected = _run(monkeypatch, capsys, "a,b\n1,2\n7,8\n")[1]
+    assert code == 0
+    assert out == expected
@@ -0,0 +1,142 @@
+from fyst import Cel, Row, Table
+from fyst.table import Col
+
+
+def _table(s: str) -> str:
+    return s.strip("\n")
+
+
+def test_rowspan_skips_claimed_slots() -> None:
+    t = Table([Cel("A", span=(1, 2)), "b"], ["c"], ["d", "e"], padding=0)
+    assert str(t) == _table("""
+┌─┬─┐
+│A│b│
+│ ├─┤
+│ │c│
+├─┼─┤
+│d│e│
+└─┴─┘
+""")
+
+
+def test_rowspan_matches_placeholders() -> None:
+    t = Table([Cel("A", span=(2, 2)), "b"], ["c"], ["d", "e", "f"], padding=0)
+    p = Table(
+        [Cel("A", span=(2, 2)), "b"],
+        [None, None, "c"],
+        ["d", "e", "f"],
+        padding=0,
+    )
+    assert str(t) == str(p) == _table("""
+┌───┬─┐
+│A  │b│
+│   ├─┤
+│   │c│
+├─┬─┼─┤
+│d│e│f│
+└─┴─┴─┘
+""")
+
+
+def test_rowspan_in_middle_col() -> None:
+    t = Table(["a", Cel("B", span=(1, 2)), "c"], ["d", "e"], padding=0)
+    assert str(t) == _table("""
+┌─┬─┬─┐
+│a│B│c│
+├─┤ ├─┤
+│d│ │e│
+└─┴─┴─┘
+""")
+
+
+def test_placeholder_sizes_its_row() -> None:
+    t = Table([Cel("A", span=(1, 3)), "b"], [None], ["c"], padding=0)
+    assert str(t) == _table("""
+┌─┬─┐
+│A│b│
+│ ├─┘
+│ ├─┐
+│ │c│
+└─┴─┘
+""")
+    assert t.size == (2, 3)
+
+
+def test_cels_sized_where_drawn() -> None:
+    # "c" and "dddd" follow the row span, so they're sized in cols 1 and 2
+    t = Table(
+        Row(Cel("A", span=(1, 2)), Cel("bb", span=(2, 1))),
+        ["c", "dddd"],
+        padding=0,
+    )
+    assert str(t) == _table("""
+┌─┬──────┐
+│A│bb    │
+│ ├─┬────┤
+│ │c│dddd│
+└─┴─┴────┘
+""")
+    assert t.rc_sizes.cols == [2, 2, 5]
+
+
+def test_render_page_clips_rowspan() -> None:
+    t = Table(
+        ["h", "h"],
+        [Cel("A\nB", span=(1, 3)), "1"],
+        ["2"],
+        ["3"],
+        ["4", "5"],
+        padding=0,
+    )
+    assert t.render_page(1, 2, header_rows=1) == _table("""
+┌─┬─┐
+│h│h│
+├─┼─┤
+│A│2│
+│B├─┤
+│ │3│
+└─┴─┘
+""")
+
+
+def test_changes_after_measure() -> None:
+    t = Table(["a", "b"], padding=0)
+    t.measure()
+    t.append(Row("c", "d", "e"))
+    assert t.size == (3, 2)
+    assert str(t) == _table("""
+┌─┬─┐  
+│a│b│  
+├─┼─┼─┐
+│c│d│e│
+└─┴─┴─┘
+""")
+
+
+def test_col_formats_follow_changes() -> None:
+    t = Table(Row("h", 1.5), cols=[Col(), Col(format=".3f")], padding=0)
+    assert "1.500" in str(t)
+    t.cols = []
+    assert "1.500" not in str(t) and "1.5" in str(t)
+
+    t = Table(Row("h", 1.5), cols=[Col(), Col(format=".3f")], padding=0)
+    str(t)
+    t[0].pop(0)
+    t.invalidate()
+    assert "1.500" not in str(t)
+
+
+def test_columnar_formats_follow_changes() -> None:
+    t = Table.from_columns([1.5, 22.25], cols=[Col(format=".3f")], padding=0)
+    assert "22.250" in str(t)
+    t.cols = [Col(format=".1f")]
+    assert "22.2" in str(t) and "22.250" not in str(t)
+    list(t[0])
+    t.invalidate()
+    assert str(t) == _table("""
+┌────┐
+│1.5 │
+├────┤
+│22.2│
+└────┘
+""")
@@ -0,0 +1,35 @@
+import pytest
+
+from fyst.width import str_cells, str_width, truncate
+
+
+@pytest.mark.parametrize("s, cells", [
+    ("abc", ["a", "b", "c"]),
+    ("あい", ["あ", "", "い", ""]),
+    ("ｆ!", ["ｆ", "", "!"]),
+    ("\U0001f44d", ["\U0001f44d", ""]),
+    ("e\u0301x", ["e\u0301", "x"]),
+    ("あ\u0301b", ["あ\u0301", "", "b"]),
+    ("a\u200bb", ["a\u200b", "b"]),
+    ("\u0301a", ["\u0301a"]),
+    ("\u200b\u0301あ", ["\u200b\u0301あ", ""]),
+])
+def test_str_cells(s: str, cells: list[str]) -> None:
+    assert str_cells(s) == cells
+    assert str_width(s) == len(cells)
+    assert "".join(cells) == s
+
+
+@pytest.mark.parametrize("s, width, ellipsis, expected", [
+    ("abcdef", 6, "…", "abcdef"),
+    ("abcdef", 4, "…", "abc…"),
+    ("abcdef", 4, "...", "a..."),
+    ("abcdef", 3, "...", "..."),
+    ("abcdef", 2, "...", ".."),
+    ("abcdef", 0, "...", ""),
+    ("abcdef", 3, "ああ", "あ "),
+    ("あいう", 4, "…", "あ …"),
+    ("あいう", 3, "…", "あ…"),
+])
+def test_truncate(s: str, width: int, ellipsis: str, expected: str) -> None:
+    assert truncate(s, width, ellipsis) == expected